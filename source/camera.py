@@ -16,6 +16,22 @@ class Camera:
         self.shake_intensity = 0
         self.shake_duration = 1
 
+        self.screen_size = None
+        self.update_screen_metrics()
+
+    def update_screen_metrics(self):
+        # framing offsets only change with the window size
+        screen_size = (self.game.screen_width, self.game.screen_height)
+        if screen_size == self.screen_size:
+            return
+
+        self.screen_size = screen_size
+        self.half_width = screen_size[0] / 2
+        self.quarter_width = screen_size[0] / 4
+        self.follow_height = screen_size[1] / 1.5
+        self.lead_down = screen_size[1] / 4
+        self.lead_up = screen_size[1] / 7
+
     def load_settings(self, player_x, player_y):
         self.x = player_x - self.game.screen_width / 2
         self.y = player_y - self.game.screen_height / 1.5
@@ -56,23 +72,34 @@ class Camera:
             return
 
         player = self.game.player
+        self.update_screen_metrics()
 
-        if player.enable_cam_mouse:
-            mouse_dist_from_player_x = (pg.mouse.get_pos()[0] + self.x) - player.x
-            mouse_dist_from_player_y = (pg.mouse.get_pos()[1] + self.y) - player.y
-
-            target_cam_x = player.x - self.game.screen_width / 2 + mouse_dist_from_player_x * 0.1
-            target_cam_y = player.y - self.game.screen_height / 1.5 + mouse_dist_from_player_y * 0.1
+        target_cam_x = player.x - self.half_width
+        target_cam_y = player.y - self.follow_height
 
-        else:
-            target_cam_x = player.x - self.game.screen_width / 2
-            target_cam_y = player.y - self.game.screen_height / 1.5
+        if player.enable_cam_mouse:
+            mouse_x, mouse_y = pg.mouse.get_pos()
+            target_cam_x += ((mouse_x + self.x) - player.x) * 0.1
+            target_cam_y += ((mouse_y + self.y) - player.y) * 0.1
 
         base_cam_x = self.x + (target_cam_x - self.x) * self.smoothing_factor
         base_cam_y = self.y + (target_cam_y - self.y) * self.smoothing_factor
 
-        base_cam_x = max(min(base_cam_x, target_cam_x + self.game.screen_width / 4), target_cam_x - self.game.screen_width / 4)
-        base_cam_y = max(min(base_cam_y, target_cam_y + self.game.screen_height / 4), target_cam_y - self.game.screen_height / 7)
+        min_cam_x = target_cam_x - self.quarter_width
+        max_cam_x = target_cam_x + self.quarter_width
+        if base_cam_x < min_cam_x:
+            base_cam_x = min_cam_x
+
+        elif base_cam_x > max_cam_x:
+            base_cam_x = max_cam_x
+
+        min_cam_y = target_cam_y - self.lead_up
+        max_cam_y = target_cam_y + self.lead_down
+        if base_cam_y < min_cam_y:
+            base_cam_y = min_cam_y
+
+        elif base_cam_y > max_cam_y:
+            base_cam_y = max_cam_y
 
         shake_offset_x, shake_offset_y = self.update_shake()
         self.x = base_cam_x + shake_offset_x
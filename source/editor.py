@@ -15,6 +15,9 @@ pg.display.set_caption("Tile Map Editor")
 font = pg.font.SysFont("Consolas", 18)
 font_small = pg.font.SysFont("Consolas", 13)
 
+entity_placeholder = pg.Surface((44, 44), pg.SRCALPHA)
+entity_placeholder.fill((120, 60, 120, 180))
+
 MAPS_ROOT = "assets/maps"
 TILESHEETS_ROOT = "assets/sprites/maps/tile_sheets"
 ENTITIES_FILE = "assets/settings/entities_config.json"
@@ -28,6 +31,7 @@ ANIMATION_SPEED = 0.1
 MAX_ANIMATION_FRAMES = 10
 
 ENTITY_TYPES = ["items", "npcs", "enemies", "actors", "player"]
+ENTITY_TYPE_PLURALS = {"item": "items", "npc": "npcs", "enemy": "enemies", "actor": "actors"}
 VISUAL_SCALE = 2
 BASE_TILE_SIZE = 16
 
@@ -56,6 +60,12 @@ instance_panel_width = 280
 instance_panel_scroll = 0
 
 entity_preview_cache = {}
+entity_sheet_cache = {}
+text_cache = {}
+documentation_surface = None
+documentation_overlay = None
+zoomed_tile_cache = {}
+zoomed_tile_cache_zoom = None
 
 editing_animation = False
 current_animated_tile = None
@@ -77,6 +87,14 @@ def ask_input(prompt, default=None):
     
     return val
 
+def render_text(text_font, text, color):
+    key = (text_font, text, color)
+    
+    if key not in text_cache:
+        text_cache[key] = text_font.render(text, True, color)
+    
+    return text_cache[key]
+
 def list_maps():
     if not os.path.exists(MAPS_ROOT):
         os.makedirs(MAPS_ROOT)
@@ -223,7 +241,12 @@ def get_entity_preview(entity_info: dict, size: int = 40):
         return entity_preview_cache[cache_key]
 
     try:
-        sheet = pg.image.load(sheet_path).convert_alpha()
+        sheet = entity_sheet_cache.get(sheet_path)
+        
+        if sheet is None: # previews share sheets, only read each file once
+            sheet = pg.image.load(sheet_path).convert_alpha()
+            entity_sheet_cache[sheet_path] = sheet
+            
         tile = sheet.subsurface((col * tile_w, row * tile_h, tile_w, tile_h))
         preview = pg.transform.scale(tile, (size, size))
         entity_preview_cache[cache_key] = preview
@@ -327,9 +350,31 @@ def draw_grid(panel_width):
         pg.draw.line(screen, (50, 50, 50), (0, y * zoom_level),
                      ((screen.get_width() - panel_width), y * zoom_level))
 
+def get_zoomed_tile(source, direction, faded):
+    global zoomed_tile_cache_zoom
+    
+    if zoomed_tile_cache_zoom != zoom_level: # sizes are only valid for one zoom level
+        zoomed_tile_cache.clear()
+        zoomed_tile_cache_zoom = zoom_level
+    
+    key = (source, direction, faded)
+    
+    if key not in zoomed_tile_cache:
+        img = pg.transform.scale(source,
+            (int(source.get_width() * zoom_level), int(source.get_height() * zoom_level)))
+        img = pg.transform.rotate(img, direction)
+        
+        if faded:
+            img.fill((255, 255, 255, 96), None, pg.BLEND_RGBA_MULT)
+        
+        zoomed_tile_cache[key] = img
+    
+    return zoomed_tile_cache[key]
+
 def draw_tiles(tiles, all_tile_surfaces, camera_x, camera_y,
                show_layers=False, current_layer=0, layer_mode=False, panel_width=256):
     current_time = time.time()
+    screen_w, screen_h = screen.get_size()
     
     regular_tiles = [t for t in tiles if t.get("type") not in ("entity", "player_spawn")]
     
@@ -338,6 +383,10 @@ def draw_tiles(tiles, all_tile_surfaces, camera_x, camera_y,
         tx = tile["x"] * visual_size - camera_x * zoom_level
         ty = tile["y"] * visual_size - camera_y * zoom_level
 
+        # off screen, leave a tile of margin for rotated images
+        if tx >= screen_w or ty >= screen_h or tx + visual_size * 2 < 0 or ty + visual_size * 2 < 0:
+            continue
+
         if "animation" in tile:
             anim = tile["animation"]
             frames = anim["frames"]
@@ -354,18 +403,13 @@ def draw_tiles(tiles, all_tile_surfaces, camera_x, camera_y,
             tile_surfaces = all_tile_surfaces[tilesheet_idx]["surfaces"]
             
             if tile_id < len(tile_surfaces):
-                img = tile_surfaces[tile_id].copy()
-                img = pg.transform.scale(img,
-                    (int(img.get_width() * zoom_level), int(img.get_height() * zoom_level)))
-                img = pg.transform.rotate(img, tile.get("direction", 0))
-                
-                if layer_mode and tile["layer"] != current_layer:
-                    img.fill((255, 255, 255, 96), None, pg.BLEND_RGBA_MULT)
+                img = get_zoomed_tile(tile_surfaces[tile_id], tile.get("direction", 0),
+                                      layer_mode and tile["layer"] != current_layer)
                 
                 screen.blit(img, (tx, ty))
 
         if show_layers:
-            layer_text = font.render(str(tile["layer"]), True, (255, 255, 255))
+            layer_text = render_text(font, str(tile["layer"]), (255, 255, 255))
             text_rect = layer_text.get_rect(center=(tx + visual_size // 2, ty + visual_size // 2))
             screen.blit(layer_text, text_rect)
 
@@ -382,6 +426,9 @@ def draw_tiles(tiles, all_tile_surfaces, camera_x, camera_y,
             visual_size = all_tile_surfaces[0]["visual_size"] * zoom_level
             tx = tile["x"] * visual_size - camera_x * zoom_level
             ty = tile["y"] * visual_size - camera_y * zoom_level
+
+            if tx >= screen_w or ty >= screen_h or tx + visual_size < 0 or ty + visual_size < 0:
+                continue
             
             if tile.get("type") == "player_spawn":
                 preview = get_entity_preview({"__player__": True}, int(visual_size))
@@ -391,7 +438,7 @@ def draw_tiles(tiles, all_tile_surfaces, camera_x, camera_y,
                 else:
                     pg.draw.rect(screen, (100, 180, 255), (tx, ty, visual_size, visual_size))
                 
-                label = font_small.render("SPAWN", True, (255, 255, 255))
+                label = render_text(font_small, "SPAWN", (255, 255, 255))
                 bg_rect = pg.Rect(tx, ty + visual_size - 16, visual_size, 16)
                 pg.draw.rect(screen, (0, 0, 0), bg_rect)
                 screen.blit(label, (tx + 2, ty + visual_size - 15))
@@ -404,8 +451,7 @@ def draw_tiles(tiles, all_tile_surfaces, camera_x, camera_y,
             ent_type = tile.get("entity_type", "items")
             ent_name = tile.get("entity_name", "")
             
-            singular_to_plural = {"item": "items", "npc": "npcs", "enemy": "enemies", "actor": "actors"}
-            lookup_type = singular_to_plural.get(ent_type, ent_type)
+            lookup_type = ENTITY_TYPE_PLURALS.get(ent_type, ent_type)
             
             ent_info = entity_data.get(lookup_type, {}).get(ent_name)
             preview = get_entity_preview(ent_info, int(visual_size)) if ent_info else None
@@ -416,17 +462,17 @@ def draw_tiles(tiles, all_tile_surfaces, camera_x, camera_y,
             else:
                 pg.draw.rect(screen, (200, 100, 200), (tx, ty, visual_size, visual_size))
             
-            label = font_small.render(ent_name[:8], True, (255, 255, 255))
+            label = render_text(font_small, ent_name[:8], (255, 255, 255))
             bg_rect = pg.Rect(tx, ty + visual_size - 16, visual_size, 16)
             pg.draw.rect(screen, (0, 0, 0), bg_rect)
             screen.blit(label, (tx + 2, ty + visual_size - 15))
             
             if tile.get("overrides"):
-                badge = font_small.render("✎", True, (255, 220, 0))
+                badge = render_text(font_small, "✎", (255, 220, 0))
                 screen.blit(badge, (tx + 2, ty + 2))
             
             if show_layers:
-                layer_text = font.render(str(tile["layer"]), True, (255, 255, 255))
+                layer_text = render_text(font, str(tile["layer"]), (255, 255, 255))
                 text_rect = layer_text.get_rect(center=(tx + visual_size // 2, ty + visual_size // 2))
                 screen.blit(layer_text, text_rect)
             
@@ -496,13 +542,20 @@ def draw_tile_selector(all_tile_surfaces, selected_tile_info, scroll_y, panel_wi
         color = (70, 70, 70) if selected_tile_info["tilesheet"] != i else (100, 100, 100)
         pg.draw.rect(screen, color, tab_rect)
         pg.draw.rect(screen, (50, 50, 50), tab_rect, 1)
-        label = font.render(f"Sheet {i+1}", True, (255, 255, 255))
+        label = render_text(font, f"Sheet {i+1}", (255, 255, 255))
         screen.blit(label, (tab_rect.x + 5, tab_rect.y + 5))
     
     current_sheet = all_tile_surfaces[selected_tile_info["tilesheet"]]
     tiles_per_row = max(1, (panel_width - 10) // visual_size)
+
+    # only walk the rows that can be on screen
+    first_row = max(0, int((-panel_y - 30) // visual_size) - 2)
+    last_row = int((screen.get_height() - panel_y - 30) // visual_size)
+    first_index = first_row * tiles_per_row
+    last_index = min(len(current_sheet["surfaces"]), (last_row + 1) * tiles_per_row)
     
-    for i, tile in enumerate(current_sheet["surfaces"]):
+    for i in range(first_index, last_index):
+        tile = current_sheet["surfaces"][i]
         row = (i // tiles_per_row) + 1
         col = i % tiles_per_row
         x = panel_x + col * visual_size
@@ -571,7 +624,7 @@ def draw_entity_selector(entity_data, selected_entity_type, selected_entity,
         color = (60, 60, 80) if selected_entity_type != entity_type else (90, 90, 130)
         pg.draw.rect(screen, color, tab_rect)
         pg.draw.rect(screen, (50, 50, 70), tab_rect, 1)
-        label = font_small.render(entity_type.capitalize(), True, (220, 220, 255))
+        label = render_text(font_small, entity_type.capitalize(), (220, 220, 255))
         screen.blit(label, (tab_rect.x + 4, tab_rect.y + 7))
 
     if selected_entity_type == "player":
@@ -585,9 +638,9 @@ def draw_entity_selector(entity_data, selected_entity_type, selected_entity,
         if preview:
             screen.blit(preview, (panel_x + 4, panel_y + 37))
         
-        name_text = font.render("Player Spawn", True, (255, 255, 255))
+        name_text = render_text(font, "Player Spawn", (255, 255, 255))
         screen.blit(name_text, (panel_x + 54, panel_y + 38))
-        type_text = font_small.render("spawn point", True, (160, 160, 200))
+        type_text = render_text(font_small, "spawn point", (160, 160, 200))
         screen.blit(type_text, (panel_x + 54, panel_y + 60))
         return
 
@@ -612,16 +665,14 @@ def draw_entity_selector(entity_data, selected_entity_type, selected_entity,
                     text_x = panel_x + 54
                 
                 else:
-                    ph = pg.Surface((44, 44), pg.SRCALPHA)
-                    ph.fill((120, 60, 120, 180))
-                    screen.blit(ph, (panel_x + 4, y + 7))
+                    screen.blit(entity_placeholder, (panel_x + 4, y + 7))
                     text_x = panel_x + 54
 
-                name_text = font.render(name, True, (255, 255, 255))
+                name_text = render_text(font, name, (255, 255, 255))
                 screen.blit(name_text, (text_x, y + 8))
                 
                 type_label = data.get("type", "?")
-                type_text = font_small.render(type_label, True, (160, 160, 200))
+                type_text = render_text(font_small, type_label, (160, 160, 200))
                 screen.blit(type_text, (text_x, y + 30))
 
 def entity_selector_click(mx, my, scroll_y, panel_width, entity_data, selected_entity_type):
@@ -687,8 +738,7 @@ def draw_instance_panel(tile, entity_data):
     screen.blit(sub, (8, y))
     y += 20
 
-    plural = {"item": "items", "npc": "npcs", "enemy": "enemies", "actor": "actors"}
-    data_key = plural.get(etype, etype)
+    data_key = ENTITY_TYPE_PLURALS.get(etype, etype)
     ent_info = entity_data.get(data_key, entity_data.get(etype, {})).get(ename, {})
     preview = get_entity_preview(ent_info, 64)
     
@@ -735,7 +785,7 @@ def draw_instance_panel(tile, entity_data):
         if editing_instance_key == key:
             pg.draw.rect(screen, (100, 80, 160), row_rect, 2)
 
-        key_surf = font_small.render(key + ":", True, (200, 200, 220))
+        key_surf = render_text(font_small, key + ":", (200, 200, 220))
         screen.blit(key_surf, (8, y + 3))
 
         if editing_instance_key == key:
@@ -786,8 +836,8 @@ def draw_version_menu(versions, scroll_offset, selected_index):
         if i == selected_index:
             pg.draw.rect(screen, (80, 80, 80), (x + 20, item_y, menu_width - 40, 30))
         
-        time_text = font.render(version.timestamp, True, (200, 200, 200))
-        comment_text = font.render(version.comment[:50], True, (150, 150, 255))
+        time_text = render_text(font, version.timestamp, (200, 200, 200))
+        comment_text = render_text(font, version.comment[:50], (150, 150, 255))
         screen.blit(time_text, (x + 30, item_y + 5))
         screen.blit(comment_text, (x + 250, item_y + 5))
     
@@ -907,8 +957,7 @@ def handle_animation_editor_events(event, tile, selected_tile_info, all_tile_sur
 def commit_instance_edit(tile, key, raw_value, entity_data):
     etype = tile.get("entity_type", "")
     ename = tile.get("entity_name", "")
-    plural = {"item": "items", "npc": "npcs", "enemy": "enemies", "actor": "actors"}
-    data_key = plural.get(etype, etype)
+    data_key = ENTITY_TYPE_PLURALS.get(etype, etype)
     base = entity_data.get(data_key, entity_data.get(etype, {})).get(ename, {})
     base_val = base.get(key)
     overrides = tile.setdefault("overrides", {})
@@ -937,19 +986,13 @@ def commit_instance_edit(tile, key, raw_value, entity_data):
         except ValueError:
             overrides[key] = raw_value
 
-def draw_documentation():
-    overlay = pg.Surface(screen.get_size(), pg.SRCALPHA)
-    overlay.fill((0, 0, 0, 200))
-    screen.blit(overlay, (0, 0))
-    
-    doc_width, doc_height = 800, 600
-    x = (screen.get_width() - doc_width) // 2
-    y = (screen.get_height() - doc_height) // 2
-    pg.draw.rect(screen, (40, 40, 50), (x, y, doc_width, doc_height))
-    pg.draw.rect(screen, (100, 100, 120), (x, y, doc_width, doc_height), 2)
+def build_documentation_surface(doc_width, doc_height):
+    surface = pg.Surface((doc_width, doc_height))
+    surface.fill((40, 40, 50))
+    pg.draw.rect(surface, (100, 100, 120), (0, 0, doc_width, doc_height), 2)
     
     title = font.render("Tile Map Editor - Keyboard Shortcuts", True, (255, 255, 200))
-    screen.blit(title, (x + 20, y + 20))
+    surface.blit(title, (20, 20))
     
     shortcuts = [
         ("General", ""),
@@ -998,9 +1041,9 @@ def draw_documentation():
     ]
     
     line_height = 24
-    col1_x = x + 30
-    col2_x = x + 260
-    y_offset = y + 60
+    col1_x = 30
+    col2_x = 260
+    y_offset = 60
     
     for key, desc in shortcuts:
         if key == "":
@@ -1008,14 +1051,34 @@ def draw_documentation():
             continue
         key_surf = font_small.render(key, True, (220, 220, 100))
         desc_surf = font_small.render(desc, True, (200, 200, 200))
-        screen.blit(key_surf, (col1_x, y_offset))
-        screen.blit(desc_surf, (col2_x, y_offset))
+        surface.blit(key_surf, (col1_x, y_offset))
+        surface.blit(desc_surf, (col2_x, y_offset))
         y_offset += line_height
-        if y_offset > y + doc_height - 40:
+        if y_offset > doc_height - 40:
             break
     
     close_text = font_small.render("Press F1 or ? again to close", True, (180, 180, 180))
-    screen.blit(close_text, (x + doc_width - 200, y + doc_height - 30))
+    surface.blit(close_text, (doc_width - 200, doc_height - 30))
+    
+    return surface
+
+def draw_documentation():
+    global documentation_surface, documentation_overlay
+    
+    if documentation_overlay is None or documentation_overlay.get_size() != screen.get_size():
+        documentation_overlay = pg.Surface(screen.get_size(), pg.SRCALPHA)
+        documentation_overlay.fill((0, 0, 0, 200))
+    
+    screen.blit(documentation_overlay, (0, 0))
+    
+    doc_width, doc_height = 800, 600
+    x = (screen.get_width() - doc_width) // 2
+    y = (screen.get_height() - doc_height) // 2
+    
+    if documentation_surface is None: # the help text never changes, build it once
+        documentation_surface = build_documentation_surface(doc_width, doc_height)
+    
+    screen.blit(documentation_surface, (x, y))
 
 print("=== Tile Map Editor ===")
 
@@ -1170,8 +1233,7 @@ while running:
                                 editing_instance_key = clicked_key
                                 etype = instance_panel_tile.get("entity_type", "")
                                 ename = instance_panel_tile.get("entity_name", "")
-                                plural = {"item": "items", "npc": "npcs", "enemy": "enemies", "actor": "actors"}
-                                data_key = plural.get(etype, etype)
+                                data_key = ENTITY_TYPE_PLURALS.get(etype, etype)
                                 base = entity_data.get(data_key, entity_data.get(etype, {})).get(ename, {})
                                 ov = instance_panel_tile.get("overrides", {})
                                 editing_instance_value = str(ov.get(clicked_key, base.get(clicked_key, "")))
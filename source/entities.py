@@ -22,10 +22,7 @@ class Entities:
             ]
         }
         
-        self.smoke_images = { # Ik this is super specific but i dont want to write a particle manager
-            1: pg.image.load("assets/sprites/particles/smoke1.png").convert_alpha(),
-            2: pg.image.load("assets/sprites/particles/smoke2.png").convert_alpha(),
-        }
+        self.smoke_images = self.game.player.smoke_images # player already loads these, no need to decode them twice
            
         random.seed(self.game.game_context.seed)
         
@@ -922,7 +919,7 @@ class Entities:
             
             player_center = (self.game.player.x - cam_x, self.game.player.y - cam_y)
             entity_center = (entity["x"] - cam_x, entity["y"] - cam_y)
-            distance = math.sqrt((player_center[0]-entity_center[0])**2 + (player_center[1]-entity_center[1])**2)
+            distance = math.hypot(self.game.player.x - entity["x"], self.game.player.y - entity["y"])
             
             if distance <= aggro_range:
                 pg.draw.line(
@@ -198,6 +198,7 @@ class GameContext:
         new_inventory[index] = base_item
 
       self.game.player.inventory = new_inventory
+      self.game.player.rebuild_inventory_index()
       self.game.player.settings_loaded = True
 
       self.saved_world_entities = self.game.data_manager.get_setting("world_entities", None)
@@ -279,7 +280,7 @@ class GameContext:
     self.current_map = None
 
   def clear_ui(self):
-    self.game.ui.ui_elements.clear()
+    self.game.ui.clear_ui_elements()
     #self.game.ui.clear_all_cache()
     
   def load_map(self, map_name):
@@ -33,6 +33,10 @@ class Map:
         self.all_tile_surfaces = []
         
         self.tile_attributes = {}
+        self.tile_swimmable = []
+        self.tile_slippy = []
+        self.tile_friction = []
+        self.tile_damage = []
         self.non_empty_cells = set()
 
     def load(self, map_path):
@@ -75,6 +79,7 @@ class Map:
                 return False
 
             self.generate_tile_hitboxes()
+            self.build_attribute_tables()
             self.init_spatial_grid()
 
             print(f"Map loaded successfully from: {map_path}")
@@ -147,6 +152,24 @@ class Map:
 
         print(f"Generated {len(self.tile_hitboxes)} tile hitboxes.")
 
+    def build_attribute_tables(self):
+        # physics attributes flattened into lists indexed by tile id, collision code reads these every frame
+        table_size = max([*self.tile_id, *self.tile_attributes, -1]) + 1
+
+        self.tile_swimmable = [False] * table_size
+        self.tile_slippy = [False] * table_size
+        self.tile_friction = [0] * table_size
+        self.tile_damage = [0] * table_size
+
+        for tile_id, attributes in self.tile_attributes.items():
+            if tile_id < 0:
+                continue
+
+            self.tile_swimmable[tile_id] = attributes.get("swimmable", False)
+            self.tile_slippy[tile_id] = attributes.get("slippy", False)
+            self.tile_friction[tile_id] = attributes.get("friction", 0)
+            self.tile_damage[tile_id] = attributes.get("damage", 0)
+
     def init_spatial_grid(self):
         self.non_empty_cells = set()
         if not self.tile_hitboxes:
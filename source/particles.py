@@ -3,21 +3,26 @@ from collections import deque
 
 class Particle:
     __slots__ = (
-        "pos", "vel", "color", "radius", "lifespan", "age", 
-        "image", "rect", "fade", "gravity", "friction", 
-        "floor_behavior", "on_ground"
+        "pos_x", "pos_y", "vel_x", "vel_y", "color", "radius", "lifespan", "age", 
+        "image", "width", "height", "half_width", "half_height", "fade", "gravity", 
+        "friction", "floor_behavior", "on_ground"
     )
     
     def __init__(self):
-        self.pos = pg.Vector2(0, 0)
-        self.vel = pg.Vector2(0, 0)
+        self.pos_x = 0.0
+        self.pos_y = 0.0
+        self.vel_x = 0.0
+        self.vel_y = 0.0
         
         self.color = (255, 255, 255)
         self.radius = 0
         self.lifespan = 0
         self.age = 0
         self.image = None
-        self.rect = pg.Rect(0, 0, 0, 0)
+        self.width = 0
+        self.height = 0
+        self.half_width = 0
+        self.half_height = 0
         self.fade = False
         self.gravity = 0.0
         self.friction = None
@@ -26,9 +31,11 @@ class Particle:
     
     def reset(self, pos, velocity, color=(255, 255, 255), radius=5, lifespan=30,
               image=None, fade=False, gravity=0.0, floor_behavior=None, friction=None):
-        self.pos = pg.Vector2(pos)
-        self.vel = pg.Vector2(velocity)
-        self.color = color
+        # unpack once here so the per-frame loops only touch plain floats
+        self.pos_x, self.pos_y = pos[0], pos[1]
+        self.vel_x, self.vel_y = velocity[0], velocity[1]
+        # fade surfaces are cached by color, so it has to be hashable
+        self.color = color if type(color) is tuple else tuple(color)
         self.radius = radius
         self.lifespan = lifespan
         self.age = 0
@@ -40,10 +47,13 @@ class Particle:
         self.on_ground = False
         
         if image:
-            self.rect = image.get_rect(center=pos)
+            self.width, self.height = image.get_size()
+            self.half_width = self.width // 2
+            self.half_height = self.height // 2
             
         else:
-            self.rect = pg.Rect(pos[0] - radius, pos[1] - radius, radius * 2, radius * 2)
+            self.width = self.height = radius * 2
+            self.half_width = self.half_height = radius
         
         return self
     
@@ -60,14 +70,9 @@ class Particles:
         self.enable_particles = True
         self.max_particles = game.game_context.max_particles
         
-        self.update_tile_hitboxes()
-
-    def update_tile_hitboxes(self):
-        if hasattr(self.game.map, "tile_hitboxes"):
-            self.tile_hitboxes = [[rect.x, rect.y, rect.width, rect.height] for rect in self.game.map.tile_hitboxes]
-            
-        else:
-            self.tile_hitboxes = []
+        # faded rect particles share surfaces per (size, color, alpha step) instead of allocating one per frame
+        self.fade_surface_cache = {}
+        self.fade_alpha_shift = 4 # 16 alpha levels
 
     def get_particle_from_pool(self):
         if self.pool:
@@ -78,6 +83,19 @@ class Particles:
         if len(self.pool) < self.max_particles * 2:
             self.pool.append(particle)
 
+    def get_fade_surface(self, width, height, color, alpha):
+        alpha_bin = alpha >> self.fade_alpha_shift
+        key = (width, height, color, alpha_bin)
+        
+        fade_surface = self.fade_surface_cache.get(key)
+        if fade_surface is None:
+            fade_surface = pg.Surface((width, height), pg.SRCALPHA)
+            fade_surface.fill(color)
+            fade_surface.set_alpha(alpha_bin << self.fade_alpha_shift)
+            self.fade_surface_cache[key] = fade_surface
+            
+        return fade_surface
+
     def find_valid_spawn_position(self, pos, radius):
         x, y = pos
         particle_rect = pg.Rect(x - radius, y - radius, radius * 2, radius * 2)
@@ -111,92 +129,91 @@ class Particles:
 
     def handle_tile_collisions(self, particle):
         radius = particle.radius
-        pos = particle.pos
-        vel = particle.vel
+        pos_x, pos_y = particle.pos_x, particle.pos_y
+        vel_x, vel_y = particle.vel_x, particle.vel_y
 
+        if not hasattr(self.game.map, "get_nearby_tiles"):
+            particle.pos_x = pos_x + vel_x
+            particle.pos_y = pos_y + vel_y
+            return
+            
         rect = pg.Rect(
-            pos.x - radius,
-            pos.y - radius,
+            pos_x - radius,
+            pos_y - radius,
             radius * 2,
             radius * 2
         )
-
-        if not hasattr(self.game.map, "get_nearby_tiles"):
-            pos += vel
-            return
             
         particle.on_ground = False
 
-        pos.x += vel.x
-        rect.x = pos.x - radius
+        pos_x += vel_x
+        rect.x = pos_x - radius
         nearby_tiles = self.game.map.get_nearby_tiles(rect)
 
         for tile_hitbox, _ in nearby_tiles:
             if rect.colliderect(tile_hitbox):
-                if vel.x > 0:
-                    pos.x = tile_hitbox.left - radius
+                if vel_x > 0:
+                    pos_x = tile_hitbox.left - radius
                     
-                elif vel.x < 0:
-                    pos.x = tile_hitbox.right + radius
+                elif vel_x < 0:
+                    pos_x = tile_hitbox.right + radius
                     
-                vel.x = 0
-                rect.x = pos.x - radius
+                vel_x = 0
+                rect.x = pos_x - radius
 
-        pos.y += vel.y
-        rect.y = pos.y - radius
+        pos_y += vel_y
+        rect.y = pos_y - radius
         nearby_tiles = self.game.map.get_nearby_tiles(rect)
 
         for tile_hitbox, _ in nearby_tiles:
             if rect.colliderect(tile_hitbox):
-                if vel.y > 0:
-                    pos.y = tile_hitbox.top - radius
+                if vel_y > 0:
+                    pos_y = tile_hitbox.top - radius
                     particle.on_ground = True
                     
                     if particle.floor_behavior == "bounce":
-                        vel.y *= -0.6
-                        if abs(vel.y) < 0.5:
-                            vel.y = 0
+                        vel_y *= -0.6
+                        if abs(vel_y) < 0.5:
+                            vel_y = 0
                             
                     else:
-                        vel.y = 0
+                        vel_y = 0
                         
-                elif vel.y < 0:
-                    pos.y = tile_hitbox.bottom + radius
-                    vel.y = 0
+                elif vel_y < 0:
+                    pos_y = tile_hitbox.bottom + radius
+                    vel_y = 0
                     
-                rect.y = pos.y - radius
+                rect.y = pos_y - radius
 
-    def render_particle(self, surface, particle):
-        screen_width, screen_height = self.game.screen_width, self.game.screen_height
-        cam_x, cam_y = self.game.camera.x, self.game.camera.y
+        particle.pos_x, particle.pos_y = pos_x, pos_y
+        particle.vel_x, particle.vel_y = vel_x, vel_y
 
-        screen_x = particle.rect.x - cam_x
-        screen_y = particle.rect.y - cam_y
-        w, h = particle.rect.width, particle.rect.height
+    def render_particle(self, surface, particle, cam_x, cam_y, screen_width, screen_height, blit_sequence):
+        screen_x = particle.pos_x - particle.half_width - cam_x
+        screen_y = particle.pos_y - particle.half_height - cam_y
+        w, h = particle.width, particle.height
 
         if screen_x + w < 0 or screen_x > screen_width or screen_y + h < 0 or screen_y > screen_height:
             return
 
-        if self.game.game_context.menu not in {"play", "death", "pause"}:
-            return
-
+        # surface blits are queued and flushed in fblits batches, rects flush the queue first to keep spawn order
         if particle.image:
             img = particle.image
             if particle.fade:
-                alpha = max(0, 255 * (1 - particle.age / particle.lifespan))
-                img.set_alpha(alpha)
-            surface.blit(img, (screen_x, screen_y))
+                img.set_alpha(255 - 255 * particle.age // particle.lifespan)
+            blit_sequence.append((img, (screen_x, screen_y)))
             return
         
         if particle.fade:
-            alpha = max(0, 255 * (1 - particle.age / particle.lifespan))
-            temp_surf = pg.Surface((particle.rect.width, particle.rect.height), pg.SRCALPHA)
-            temp_surf.fill(particle.color)
-            temp_surf.set_alpha(alpha)
-            surface.blit(temp_surf, (screen_x, screen_y))
+            alpha = 255 - 255 * particle.age // particle.lifespan
+            blit_sequence.append((self.get_fade_surface(w, h, particle.color, alpha), (screen_x, screen_y)))
             
         else:
-            pg.draw.rect(surface, particle.color, (screen_x, screen_y, particle.rect.width, particle.rect.height))
+            if blit_sequence:
+                surface.fblits(blit_sequence)
+                blit_sequence.clear()
+
+            pg.draw.rect(surface, particle.color, (screen_x, screen_y, w, h))
 
     def generate(self, pos, velocity, color=(255, 255, 255), radius=5, lifespan=30,
                  image=None, image_size=None, fade=False, gravity=0.0,
@@ -211,60 +228,101 @@ class Particles:
         
         if image and image_size:
             image = pg.transform.scale(image, image_size)
+            
+        elif image and fade:
+            # alpha is set per particle, dont fade the callers shared surface
+            image = image.copy()
         
         particle.reset(pos, velocity, color, radius, lifespan, image, fade, gravity, floor_behavior, friction)
+        
+        # the deque would silently drop the oldest particle, hand it back to the pool instead
+        if self.particles and len(self.particles) >= self.max_particles:
+            self.recycle_particle(self.particles.popleft())
+            
         self.particles.append(particle)
 
-    def update_physics_batch(self):
-        if not self.particles:
+    def generate_batch(self, positions, velocities, radii, images, color=(255, 255, 255), lifespan=30, fade=False):
+        # many similar particles at once (jump/footstep smoke), no floor handling or per-call kwargs
+        if not self.enable_particles:
             return
+
+        particles = self.particles
+        max_particles = self.max_particles
+
+        for pos, velocity, radius, image in zip(positions, velocities, radii, images):
+            if image and fade:
+                image = image.copy()
+
+            particle = self.get_particle_from_pool()
+            particle.reset(pos, velocity, color, radius, lifespan, image, fade)
+
+            if particles and len(particles) >= max_particles:
+                self.recycle_particle(particles.popleft())
+
+            particles.append(particle)
+
+    def update_physics(self, particle):
+        particle.vel_y += particle.gravity
         
-        for particle in self.particles:
-            particle.vel.y += particle.gravity
-            
-            if particle.on_ground and particle.friction:
-                particle.vel.x *= (1 - particle.friction)
-                if abs(particle.vel.x) < 0.1:
-                    particle.vel.x = 0
-            
-            if particle.floor_behavior:
-                self.handle_tile_collisions(particle)
-                
-            else:
-                particle.pos += particle.vel
-            
-            particle.age += 1
+        if particle.on_ground and particle.friction:
+            particle.vel_x *= (1 - particle.friction)
+            if abs(particle.vel_x) < 0.1:
+                particle.vel_x = 0
+        
+        if particle.floor_behavior:
+            self.handle_tile_collisions(particle)
             
-            if particle.image:
-                particle.rect.center = particle.pos
-                
-            else:
-                particle.rect.topleft = (particle.pos.x - particle.radius, particle.pos.y - particle.radius)
+        else:
+            particle.pos_x += particle.vel_x
+            particle.pos_y += particle.vel_y
+        
+        particle.age += 1
 
     def update(self):
         if not self.particles:
             return
         
-        self.update_physics_batch()
+        # nothing would be drawn outside these menus, so skip the physics as well
+        if self.game.game_context.menu not in {"play", "death", "pause"}:
+            return
+        
+        # frame invariants, looked up once instead of per particle
+        surface = self.game.screen
+        cam_x, cam_y = self.game.camera.x, self.game.camera.y
+        screen_width, screen_height = self.game.screen_width, self.game.screen_height
+        
+        particles = self.particles
+        blit_sequence = []
         
-        for _ in range(len(self.particles)):
-            particle = self.particles.popleft()
-            if particle.is_alive():
-                self.render_particle(self.game.screen, particle)
-                self.particles.append(particle)
+        # physics, alive check and render in a single pass over the live set
+        for _ in range(len(particles)):
+            particle = particles.popleft()
+            self.update_physics(particle)
+            
+            if particle.age < particle.lifespan:
+                self.render_particle(surface, particle, cam_x, cam_y, screen_width, screen_height, blit_sequence)
+                particles.append(particle)
                 
             else:
                 self.recycle_particle(particle)
+                
+        if blit_sequence:
+            surface.fblits(blit_sequence)
 
     def clear(self):     
         for particle in self.particles:
             self.recycle_particle(particle)
         
         self.particles.clear()
+        self.fade_surface_cache.clear()
     
     def set_max_particles(self, max_particles):
         self.max_particles = max_particles
-        self.particles = deque(list(self.particles)[:max_particles], maxlen=max_particles)
+        
+        while len(self.particles) > max_particles:
+            self.recycle_particle(self.particles.popleft())
+            
+        self.particles = deque(self.particles, maxlen=max_particles)
     
     def get_particle_count(self):
         return len(self.particles)
@@ -6,19 +6,110 @@ import os
 
 from helper_methods import load_json
 
+class ControllerState:
+    __slots__ = ("left_x", "left_y", "A", "B", "X", "Y", "LB", "RB", "back", "start", "dpad")
+
+    def __init__(self):
+        self.left_x = 0
+        self.left_y = 0
+        self.A = 0
+        self.B = 0
+        self.X = 0
+        self.Y = 0
+        self.LB = 0
+        self.RB = 0
+        self.back = 0
+        self.start = 0
+        self.dpad = (0, 0)
+
+    def update(self, joystick):
+        # filled in place every frame, each axis/button is read once
+        left_x = joystick.get_axis(0)
+        left_y = joystick.get_axis(1)
+        self.left_x = left_x if abs(left_x) > 0.1 else 0
+        self.left_y = left_y if abs(left_y) > 0.1 else 0
+
+        get_button = joystick.get_button
+        self.A = get_button(0)
+        self.B = get_button(1)
+        self.X = get_button(2)
+        self.Y = get_button(3)
+        self.LB = get_button(4)
+        self.RB = get_button(5)
+        self.back = get_button(6)
+        self.start = get_button(7)
+
+        self.dpad = joystick.get_hat(0) if joystick.get_numhats() > 0 else (0, 0)
+
 class Player:
     def __init__(self, game):
         self.game = game
         
         self.enable_cam_mouse = False
         
-        self.smoke_images = { # Ik this is super specific but i dont want to write an image manager
+        self.smoke_images = { # Ik this is super specific but i dont want to write an image manager (shared with entities)
             1: pg.image.load("assets/sprites/particles/smoke1.png").convert_alpha(),
             2: pg.image.load("assets/sprites/particles/smoke2.png").convert_alpha(),
         }
+        self.smoke_variants = tuple(self.smoke_images)
+        # footstep/jump smoke only ever uses radius 2-4, scale those once instead of per particle
+        self.smoke_scaled = {
+            (variant, radius): pg.transform.scale(self.smoke_images[variant], (radius * 2, radius * 2))
+            for variant in self.smoke_variants for radius in range(2, 5)
+        }
+
+        # static data + decoded sounds, load_settings runs again on every restart/load so keep these out of it
+        self.config = load_json(os.path.join("assets", "settings", "player_config.json"))
+        self.weapon_info = load_json(os.path.join("assets", "settings", "weapon_data.json"))
+        self.item_info = load_json(os.path.join("assets", "settings", "entities_config.json"))
+        self.weapon_frame_delays = {weapon: int(1 / data["speed"]) for weapon, data in self.weapon_info.items()}
+        self.load_sounds()
+
+        # pressed key / joystick button -> gameplay action, looked up once per event
+        self.key_actions = {pg.K_i: self.toggle_inventory, pg.K_t: self.toggle_map, pg.K_LSHIFT: self.try_dash}
+        self.button_actions = {6: self.toggle_inventory, 5: self.toggle_map, 4: self.try_dash}
+
+        # full/half/empty hearts sliced and scaled once, render_health hands these straight to the UI
+        hearts_sheet = pg.image.load("assets/sprites/gui/health/Hearts.png").convert_alpha()
+        self.heart_surfaces = [
+            self.extract_frame(hearts_sheet, pg.Rect(state * 32, 0, 32, 32), (60, 60))
+            for state in range(3)
+        ]
+
+        ui_sheet = pg.image.load("assets/sprites/gui/ui.png").convert_alpha()
+        self.slot_surface = self.extract_frame(ui_sheet, pg.Rect(3 * 32, 34 * 32, 32, 32), (35, 35))
+
+    def load_sounds(self):
+        raw_sounds = self.config["sounds"]
+        self.sounds = {}
+
+        for key, entries in raw_sounds.items():
+            if isinstance(entries, list):
+                self.sounds[key] = [{"sound": pg.mixer.Sound(e["path"]), "volume": e["volume"]} for e in entries]
+                
+            else:
+                self.sounds[key] = {k: {"sound": pg.mixer.Sound(e["path"]), "volume": e["volume"]} for k, e in entries.items()}
+
+        # flat (sound, volume) pairs so volume changes dont have to walk the nested groups
+        self.sound_volumes = []
+        for sound_group in self.sounds.values():
+            sound_dicts = sound_group if isinstance(sound_group, list) else sound_group.values()
+            self.sound_volumes.extend((sound_dict["sound"], sound_dict["volume"]) for sound_dict in sound_dicts)
+
+        # bare Sound tuples for the groups that get picked at random during play
+        self.walking_sounds = tuple(entry["sound"] for entry in self.sounds["walking"])
+        self.hit_sounds = tuple(entry["sound"] for entry in self.sounds["hit"])
+        self.pickup_sounds = tuple(entry["sound"] for entry in self.sounds["pickup"])
+        self.jump_sounds = tuple(entry["sound"] for entry in self.sounds["jump"])
+        self.dash_sounds = tuple(entry["sound"] for entry in self.sounds["dash"])
+        self.attack_sounds = tuple(entry["sound"] for entry in self.sounds["attack"])
+        self.consume_sounds = tuple(entry["sound"] for entry in self.sounds["consume"])
+        self.talking_sounds = tuple(entry["sound"] for entry in self.sounds["talking"])
+        # bound stop methods, dialogue silences every talking sound before playing the next one
+        self.talking_sound_stops = tuple(sound.stop for sound in self.talking_sounds)
                    
     def load_settings(self):
-        cfg = load_json(os.path.join("assets", "settings", "player_config.json"))
+        cfg = self.config
 
         self.x = self.game.game_context.player_spawn_x
         self.y = self.game.game_context.player_spawn_y
@@ -36,7 +127,18 @@ class Player:
         self.hitbox_width = cfg["hitbox"]["width_units"] * self.scale_factor
         self.hitbox_height = cfg["hitbox"]["height_units"] * self.scale_factor
         self.hitbox = pg.Rect(self.x, self.y, self.hitbox_width, self.hitbox_height)
+        self.hitbox_position = None
         self.interact_radius = pg.Rect(self.x, self.y, self.hitbox_width, self.hitbox_height)
+        self.interact_position = None
+        self.flip_offset = {"left": 1.4, "right": 0}
+        self.foot_alignment = 3
+        self.controller = ControllerState()
+        # every (left, right, sliding, blocked) combo resolved up front, handle_movement just looks it up
+        self.movement_table = {
+            (left, right, sliding, blocked): self.resolve_movement(left, right, sliding, blocked)
+            for left in (False, True) for right in (False, True)
+            for sliding in (False, True) for blocked in (False, True)
+        }
         self.blocked_horizontally = False
 
         self.attack_timeout = cfg["combat"]["attack_timeout"]
@@ -48,10 +150,14 @@ class Player:
         self.rendered_inventory_ui_elements = []
         self.items_per_row = cfg["inventory"]["items_per_row"]
         self.item_spacing = cfg["inventory"]["item_spacing"]
+        self.inventory_grid_surface = None
         self.selected_slot = None
         self.inventory_changed = False
+        self.inventory_ui_built = False
+        self.ui_clear_count = self.game.ui.clear_count
         self.inventory_cooldown = 0
         self.inventory = {}
+        self.rebuild_inventory_index()
 
         self.max_health = cfg["health"]["max_health"]
         self.current_health = self.max_health
@@ -59,9 +165,12 @@ class Player:
         self.health_spacing = cfg["health"]["health_spacing"]
         self.invinsibility_duration = cfg["health"]["invincibility_duration"]
         self.last_damage_time = -self.invinsibility_duration * 2
+        self.previous_health = None
+        self.heart_states = [] # 0 full, 1 half, 2 empty per heart element
 
         self.pickup_tags = []
         self.max_tags = cfg["inventory"]["max_tags"]
+        self.pickup_tag_count = 0 # tags keep their ids when they shift slots, so ids come from a counter
 
         self.last_step_time = 0
         self.step_interval = cfg["footsteps"]["step_interval"]
@@ -69,6 +178,7 @@ class Player:
 
         self.in_dialogue = False
         self.dialogue_index = 0
+        self.dialogue_shown_index = None
         self.dialogue_with = None
 
         self.in_map = False
@@ -86,10 +196,10 @@ class Player:
         self.last_volume = None
 
         self.current_state = "idle"
+        self.attack_state = False
         self.direction = "right"
         self.current_frame = 0
         self.animation_timer = 0
-        self.weapon_info = load_json(os.path.join("assets", "settings", "weapon_data.json"))
         self.weapon_inventory = [] # temporary, will be replaced with actual inventory system
         self.max_weapon_inventory_slots = cfg["combat"]["max_weapon_inventory_slots"]
         self.equipped_weapon = ""
@@ -97,15 +207,10 @@ class Player:
         self.state_frames = cfg["animation"]["states"]
         self.frames = {state: [] for state in self.state_frames}
 
-        raw_sounds = cfg["sounds"]
-        self.sounds = {}
-
-        for key, entries in raw_sounds.items():
-            if isinstance(entries, list):
-                self.sounds[key] = [{"sound": pg.mixer.Sound(e["path"]), "volume": e["volume"]} for e in entries]
-                
-            else:
-                self.sounds[key] = {k: {"sound": pg.mixer.Sound(e["path"]), "volume": e["volume"]} for k, e in entries.items()}
+        # flat per-state tables so the animation path does one lookup instead of two nested ones
+        self.state_frame_counts = {state: settings["frames"] for state, settings in self.state_frames.items()}
+        # ticks per frame, int(1 / speed) worked out once instead of on every animation tick
+        self.state_frame_delays = {state: int(1 / settings["speed"]) for state, settings in self.state_frames.items()}
 
         self.charging = False
         self.charge_timer = 0
@@ -118,14 +223,16 @@ class Player:
         self.just_closed_dialogue = False
 
         random.seed(self.game.game_context.seed)
-
-        self.item_info = load_json(os.path.join("assets", "settings", "entities_config.json"))
+        # smoke draws from numpy, seed it with the save too so runs stay reproducible
+        self.rng = np.random.default_rng(self.game.game_context.seed)
 
         self.load_frames()
     
     def load_frames(self):
         self.frames = {}
         self.flipped_frames = {}
+        self.ghost_images = {}
+        self.debug_surfaces = {}
 
         self.sheet_width = 100
         self.sheet_height = 100
@@ -153,14 +260,34 @@ class Player:
                     self.sheet_height
                 )
 
-                frame_image = pg.Surface(frame_rect.size, pg.SRCALPHA).convert_alpha()
-                frame_image.blit(sheet, (0, 0), frame_rect)
-                frame_image = pg.transform.scale(frame_image, (scaled_width, scaled_height))
-
-                flipped_image = pg.transform.flip(frame_image, True, False)
+                frame_image = self.extract_frame(sheet, frame_rect, (scaled_width, scaled_height))
 
                 self.frames[state].append(frame_image)
-                self.flipped_frames[state].append(flipped_image)
+
+            # left-facing copies get flipped on first use in get_frame
+            self.flipped_frames[state] = [None] * len(self.frames[state])
+
+    def get_frame(self, state, frame_index, direction):
+        if direction != "left":
+            return self.frames[state][frame_index]
+
+        flipped = self.flipped_frames[state]
+        image = flipped[frame_index]
+        if image is None:
+            image = pg.transform.flip(self.frames[state][frame_index], True, False)
+            flipped[frame_index] = image
+
+        return image
+
+    def extract_frame(self, sheet, frame_rect, size):
+        # scale straight from a subsurface view, no intermediate surface + blit per frame
+        if sheet.get_rect().contains(frame_rect):
+            return pg.transform.scale(sheet.subsurface(frame_rect), size)
+
+        # sheet is shorter than the config says, keep the old clipped behaviour
+        frame_image = pg.Surface(frame_rect.size, pg.SRCALPHA).convert_alpha()
+        frame_image.blit(sheet, (0, 0), frame_rect)
+        return pg.transform.scale(frame_image, size)
 
     def load_weapon_animations(self):
         weapons_to_load = [w for w in self.weapon_inventory if w in self.weapon_info and w not in self.loaded_weapons]
@@ -229,14 +356,11 @@ class Player:
                         self.sheet_height
                     )
 
-                    frame_image = pg.Surface(frame_rect.size, pg.SRCALPHA).convert_alpha()
-                    frame_image.blit(sheet, (0, 0), frame_rect)
-                    frame_image = pg.transform.scale(frame_image, (scaled_width, scaled_height))
-
-                    flipped_image = pg.transform.flip(frame_image, True, False)
+                    frame_image = self.extract_frame(sheet, frame_rect, (scaled_width, scaled_height))
 
                     self.frames[state_name].append(frame_image)
-                    self.flipped_frames[state_name].append(flipped_image)
+
+                self.flipped_frames[state_name] = [None] * frames_count
 
             self.loaded_weapons.add(weapon)
 
@@ -248,84 +372,96 @@ class Player:
                     
                 if state_name in self.flipped_frames:
                     del self.flipped_frames[state_name]
+
+                for key in [key for key in self.ghost_images if key[0] == state_name]:
+                    del self.ghost_images[key]
                     
             self.loaded_weapons.remove(weapon)
 
     def update_state(self):
-        if self.last_volume != self.game.game_context.volume:
-            self.last_volume = self.game.game_context.volume
-            for sound_group in self.sounds.values():
-                if isinstance(sound_group, list):
-                    for sound_dict in sound_group:
-                        sound_dict["sound"].set_volume(self.game.game_context.volume / 10 * sound_dict["volume"])
-                        
-                elif isinstance(sound_group, dict):
-                    for sound_dict in sound_group.values():
-                        sound_dict["sound"].set_volume(self.game.game_context.volume / 10 * sound_dict["volume"])
-
-        self.current_health = math.floor(self.current_health * 2) / 2
-        self.current_health = min(self.current_health, self.max_health)
-
-        self.x += self.vel_x
-        self.y += self.vel_y
+        game_context = self.game.game_context
+        volume = game_context.volume
+        if self.last_volume != volume:
+            self.last_volume = volume
+            for sound, sound_volume in self.sound_volumes:
+                sound.set_volume(volume / 10 * sound_volume)
+
+        # snap to halves, truncation is fine since anything below 0 gets clamped right after
+        health = self.current_health
+        snapped = int(health + health) * 0.5
+        if snapped != health or health > self.max_health:
+            self.current_health = snapped if snapped < self.max_health else self.max_health
+
+        vel_x = self.vel_x
+        vel_y = self.vel_y
+        self.x += vel_x
+        self.y += vel_y
 
         self.attack_timer += 1
 
         if self.current_health < 0:
             self.current_health = 0
                 
-        if not self.equipped_weapon in self.weapon_inventory:
+        if self.equipped_weapon and self.equipped_weapon not in self.weapon_inventory:
             self.equipped_weapon = ""
 
-        if self.vel_y >= self.game.game_context.max_fall_speed:
-            self.vel_y = self.game.game_context.max_fall_speed
+        max_fall_speed = game_context.max_fall_speed
+        if vel_y >= max_fall_speed:
+            self.vel_y = max_fall_speed
 
         if self.attack_timer > self.attack_timeout:
             self.attack_sequence = 1
 
-        if self.current_state in {"death"} or getattr(self, "sliding", False):
+        is_dead = self.current_state == "death"
+
+        if is_dead or getattr(self, "sliding", False):
             if self.friction <= 0 and self.on_ground:
                 self.friction = 0.3
 
-            self.vel_x -= self.friction * (1 if self.vel_x > 0 else -1 if self.vel_x < 0 else 0)
+            if vel_x > 0:
+                vel_x -= self.friction
 
-            if abs(self.vel_x) < 0.5:
-                self.vel_x = 0
+            elif vel_x < 0:
+                vel_x += self.friction
+
+            self.vel_x = 0 if -0.5 < vel_x < 0.5 else vel_x
 
-        if self.actual_horizontal_movement and self.on_ground and not self.current_state in {"death"}:
-            if self.game.game_context.current_time - self.last_step_time > self.step_interval:
-                walking_sound = random.choice(self.sounds["walking"])
-                walking_sound["sound"].play()
-                self.last_step_time = self.game.game_context.current_time
+        if self.actual_horizontal_movement and self.on_ground and not is_dead:
+            current_time = game_context.current_time
+            if current_time - self.last_step_time > self.step_interval:
+                random.choice(self.walking_sounds).play()
+                self.last_step_time = current_time
 
                 flip_offset = 14 if self.direction == "right" else 0
 
-                for amount in range(5):
-                    base_vel_x = random.uniform(0, 0.5)
-                    if self.direction == "right":
-                        vel_x = -base_vel_x
+                # one batched draw per footstep instead of ~6 random calls per particle
+                rng = self.rng
+                if self.direction == "right":
+                    smoke_vel_x = (-rng.uniform(0, 0.5, 5)).tolist()
 
-                    elif self.direction == "left":
-                        vel_x = base_vel_x
+                elif self.direction == "left":
+                    smoke_vel_x = rng.uniform(0, 0.5, 5).tolist()
 
-                    else:
-                        vel_x = random.uniform(-0.5, 0.5)
-
-                    vel_y = random.uniform(-0.5, -0.1)
-                    radius = random.randint(2, 4)
-
-                    smoke_img = self.smoke_images[random.choice([1, 2])]
-
-                    self.game.particles.generate(
-                        pos=(self.x + self.hitbox_width / 2 - flip_offset + random.uniform(-10, 10), self.y + self.hitbox_height / 2 + random.uniform(0, 5)),
-                        velocity=(vel_x, vel_y),
-                        color=(255, 255, 255),
-                        radius=radius,
-                        lifespan=30,
-                        fade=True,
-                        image=smoke_img,
-                        image_size=(radius*2, radius*2)
-                    )
+                else:
+                    smoke_vel_x = rng.uniform(-0.5, 0.5, 5).tolist()
+
+                smoke_vel_y = rng.uniform(-0.5, -0.1, 5).tolist()
+                smoke_radius = rng.integers(2, 5, 5).tolist()
+                smoke_variant = rng.integers(0, len(self.smoke_variants), 5).tolist()
+                offset_x = rng.uniform(-10, 10, 5).tolist()
+                offset_y = rng.uniform(0, 5, 5).tolist()
+
+                base_x = self.x + self.hitbox_width / 2 - flip_offset
+                base_y = self.y + self.hitbox_height / 2
+
+                self.game.particles.generate_batch(
+                    positions=[(base_x + offset_x[i], base_y + offset_y[i]) for i in range(5)],
+                    velocities=list(zip(smoke_vel_x, smoke_vel_y)),
+                    radii=smoke_radius,
+                    images=[self.smoke_scaled[(self.smoke_variants[variant], radius)] for variant, radius in zip(smoke_variant, smoke_radius)],
+                    lifespan=30,
+                    fade=True
+                )
 
     def take_damage(self, damage):
         if self.current_state == "death":
@@ -343,8 +479,7 @@ class Player:
 
             if self.current_health < 0.5:
                 self.death()
-                hurt_sound = random.choice(self.sounds["hit"])
-                hurt_sound["sound"].play()
+                random.choice(self.hit_sounds).play()
 
             else:
                 self.current_state = "hurt"
@@ -353,8 +488,7 @@ class Player:
                 self.attacking = False
                 self.attack_sequence = (self.attack_sequence % 2) + 1
                 self.current_attack_projectile = None
-                hurt_sound = random.choice(self.sounds["hit"])
-                hurt_sound["sound"].play()
+                random.choice(self.hit_sounds).play()
 
     def death(self):
         self.current_state = "death"
@@ -369,32 +503,38 @@ class Player:
         self.game.game_context.menu = "death"
 
     def render_health(self):
-        previous_health = getattr(self, "previous_health", self.current_health)
+        if self.current_health == self.previous_health and len(self.heart_states) == self.max_health:
+            return
 
-        if previous_health != self.current_health:
-            for health in range(self.max_health):
-                self.game.ui.remove_ui_element(health)
+        if len(self.heart_states) != self.max_health:
+            for heart in range(self.max_health, len(self.heart_states)):
+                self.game.ui.remove_ui_element(heart)
 
-        for heart in range(self.max_health):
-            row = heart // self.health_per_row
-            col = heart % self.health_per_row
-
-            x_position = self.game.screen_width * 0.025 + col * self.health_spacing
-            y_position = self.game.screen_height * 0.033 + row * self.health_spacing
+            self.heart_states = [None] * self.max_health
 
+        for heart in range(self.max_health):
             if heart + 1 <= self.current_health:
-                image_path = [0, 0]
+                heart_state = 0
 
             elif heart + 1 - self.current_health == 0.5:
-                image_path = [0, 1]
+                heart_state = 1
 
             else:
-                image_path = [0, 2]
+                heart_state = 2
+
+            # only hearts that actually changed get rebuilt
+            if self.heart_states[heart] == heart_state:
+                continue
+
+            row = heart // self.health_per_row
+            col = heart % self.health_per_row
+
+            x_position = self.game.screen_width * 0.025 + col * self.health_spacing
+            y_position = self.game.screen_height * 0.033 + row * self.health_spacing
 
+            self.game.ui.remove_ui_element(heart)
             self.game.ui.create_ui(
-                sprite_sheet_path="assets/sprites/gui/health/Hearts.png",
-                image_id=image_path,
-                sprite_width=32, sprite_height=32,
+                image_surface=self.heart_surfaces[heart_state],
                 x=x_position, y=y_position,
                 centered=True, width=60, height=60,
                 alpha=True,
@@ -402,23 +542,63 @@ class Player:
                 render_order=-15
             )
 
+            self.heart_states[heart] = heart_state
+
         self.previous_health = self.current_health
 
+    def inventory_key(self, item):
+        return (item["name"], item["type"], item["value"])
+
+    def rebuild_inventory_index(self):
+        # stack key -> slot and a bitmask of used slots, so pickups dont have to scan the inventory
+        self.stack_index = {}
+        self.occupied_slots = 0
+        self.all_slots_mask = (1 << self.max_inventory_slots) - 1
+
+        for slot, inventory_item in self.inventory.items():
+            self.stack_index.setdefault(self.inventory_key(inventory_item), slot)
+            self.occupied_slots |= 1 << slot
+
+        self.occupied_slots &= self.all_slots_mask
+
     def add_item_to_inventory(self, item):
-        item_name = item["name"]
-        item_type = item["type"]
-        item_value = item["value"]
-        item_quantity = item["quantity"]
+        item_key = self.inventory_key(item)
+        stack_slot = self.stack_index.get(item_key)
 
-        for index, inventory_item in self.inventory.items():
-            if (inventory_item["name"] == item_name and inventory_item["type"] == item_type and inventory_item["value"] == item_value):
-                inventory_item["quantity"] += item_quantity
-                return
+        if stack_slot is not None:
+            self.inventory[stack_slot]["quantity"] += item["quantity"]
+            return
 
-        for index in range(self.max_inventory_slots):
-            if index not in self.inventory:
-                self.inventory[index] = item
-                return
+        free = ~self.occupied_slots & self.all_slots_mask
+        if not free:
+            return
+
+        lowest_free = free & -free
+        slot = lowest_free.bit_length() - 1
+        self.occupied_slots |= lowest_free
+        self.inventory[slot] = item
+        self.stack_index[item_key] = slot
+        self.inventory_changed = True
+
+    def remove_inventory_slot(self, slot):
+        item = self.inventory.pop(slot)
+        item_key = self.inventory_key(item)
+
+        if self.stack_index.get(item_key) == slot:
+            del self.stack_index[item_key]
+
+        self.occupied_slots &= ~(1 << slot)
+
+    def move_inventory_slot(self, from_slot, to_slot):
+        if to_slot in self.inventory:
+            self.inventory[from_slot], self.inventory[to_slot] = self.inventory[to_slot], self.inventory[from_slot]
+            self.stack_index[self.inventory_key(self.inventory[from_slot])] = from_slot
+
+        else:
+            self.inventory[to_slot] = self.inventory.pop(from_slot)
+            self.occupied_slots = (self.occupied_slots & ~(1 << from_slot)) | (1 << to_slot)
+
+        self.stack_index[self.inventory_key(self.inventory[to_slot])] = to_slot
 
     def render_item_mouse(self):
         if not self.in_inventory or self.selected_slot is None or self.selected_slot not in self.inventory:
@@ -433,11 +613,6 @@ class Player:
         item_index = item_data["index"]
         tile_sheet = item_data.get("tile_sheet", ["assets/sprites/gui/items/Sheet.png", 16, 16])
 
-        item_element_id = f"item:{item_name}"
-        if item_element_id in self.rendered_inventory_ui_elements:
-            self.game.ui.remove_ui_element(item_element_id)
-            self.rendered_inventory_ui_elements.remove(item_element_id)
-
         if hasattr(self, "mouse_item") and self.mouse_item:
             self.game.ui.remove_ui_element(self.mouse_item)
 
@@ -465,8 +640,9 @@ class Player:
 
         index = len(self.pickup_tags)
         creation_time = self.game.game_context.current_time
-        element_id = f"pickup_tag_{creation_time}_{index}"
-        text_id = f"pickup_text_{creation_time}_{index}"
+        element_id = f"pickup_tag_{self.pickup_tag_count}"
+        text_id = f"pickup_text_{self.pickup_tag_count}"
+        self.pickup_tag_count += 1
 
         item_data = self.item_info["items"][item_name]
         tile_sheet = item_data.get("tile_sheet", ["assets/sprites/gui/items/Sheet.png", 16, 16])
@@ -502,51 +678,33 @@ class Player:
             x_pos = self.game.screen_width - 100
 
         for slot, tag in enumerate(self.pickup_tags):
-            self.game.ui.remove_ui_element(tag["element_id"])
-            self.game.ui.remove_ui_element(tag["text_id"])
+            y_pos = self.game.screen_height * 0.033 + slot * 35
 
-            tag["element_id"] = f"pickup_tag_{tag['creation_time']}_{slot}"
-            tag["text_id"] = f"pickup_text_{tag['creation_time']}_{slot}"
-
-            item_data = self.item_info["items"][tag["name"]]
-            tile_sheet = item_data.get("tile_sheet", ["assets/sprites/gui/items/Sheet.png", 16, 16])
-
-            self.game.ui.create_ui(
-                sprite_sheet_path=tile_sheet[0],
-                image_id=item_data["index"],
-                sprite_width=tile_sheet[1], sprite_height=tile_sheet[2],
-                x=x_pos, y=self.game.screen_height * 0.033 + slot * 35,
-                width=30, height=30,
-                element_id=tag["element_id"],
-                render_order=2
-            )
-
-            self.game.ui.create_ui(
-                x=x_pos + 50, y=self.game.screen_height * 0.033 + slot * 35 + 15,
-                font_size=10,
-                font=self.game.game_context.fonts["fantasy"],
-                element_id=tag["text_id"],
-                render_order=2,
-                label=tag["name"]
-            )
+            self.game.ui.update_ui_position(tag["element_id"], x_pos, y_pos)
+            self.game.ui.update_ui_position(tag["text_id"], x_pos + 50, y_pos + 15)
 
     def update_pickup_tags(self):
         if not self.pickup_tags:
             return
 
-        current_time = self.game.game_context.current_time
-        expired = [tag for tag in self.pickup_tags if current_time - tag["creation_time"] >= 3000]
+        cutoff = self.game.game_context.current_time - 3000
+        kept = None # only allocated once the first expired tag shows up
 
-        if not expired:
-            return
+        for index, tag in enumerate(self.pickup_tags):
+            if tag["creation_time"] <= cutoff:
+                if kept is None:
+                    kept = self.pickup_tags[:index]
 
-        for tag in expired:
-            self.game.ui.remove_ui_element(tag["element_id"])
-            self.game.ui.remove_ui_element(tag["text_id"])
+                self.game.ui.remove_ui_element(tag["element_id"])
+                self.game.ui.remove_ui_element(tag["text_id"])
 
-        expired_ids = {id(tag) for tag in expired}
-        self.pickup_tags = [tag for tag in self.pickup_tags if id(tag) not in expired_ids]
+            elif kept is not None:
+                kept.append(tag)
+
+        if kept is None:
+            return
 
+        self.pickup_tags = kept
         self.reposition_tags()
 
     def render_item_info(self, id):
@@ -575,32 +733,54 @@ class Player:
                 render_order=1, font=self.game.game_context.fonts["fantasy"],
                 label=f"{self.inventory[id]["name"]} x{self.inventory[id]["quantity"]} Value:{self.inventory[id]["value"]}"
             )
-            self.rendered_inventory_ui_elements.append(self.inventory[id]["name"])
-            self.rendered_inventory_ui_elements.append("item_info")
+            for element_id in (self.inventory[id]["name"], "item_info"):
+                if element_id not in self.rendered_inventory_ui_elements:
+                    self.rendered_inventory_ui_elements.append(element_id)
 
             self.last_rendered_item = self.inventory[id]["name"]
 
 
     def refresh_inventory(self):
-        if self.inventory_changed:
-            for element_id in self.rendered_inventory_ui_elements:
-                self.game.ui.remove_ui_element(element_id)
+        # every rebuild starts from scratch so ids never pile up in the list
+        for element_id in self.rendered_inventory_ui_elements:
+            self.game.ui.remove_ui_element(element_id)
 
-            self.rendered_inventory_ui_elements.clear()
-            self.inventory_changed = False
+        self.rendered_inventory_ui_elements.clear()
+        self.inventory_changed = False
+
+        slot_positions = [
+            (
+                self.game.screen_width * 0.5 - (2 * self.item_spacing + 1.6) + (slot % self.items_per_row) * self.item_spacing,
+                self.game.screen_height * 0.45 + (slot // self.items_per_row - 1) * self.item_spacing
+            )
+            for slot in range(self.max_inventory_slots)
+        ]
 
-        for slot in range(self.max_inventory_slots):
-            row = slot // self.items_per_row
-            col = slot % self.items_per_row
+        # every empty slot drawn in one blit, the slot buttons below only handle clicks
+        if self.inventory_grid_surface is None:
+            self.build_inventory_grid()
 
-            x_position = self.game.screen_width * 0.5 - (2 * self.item_spacing + 1.6) + col * self.item_spacing
-            y_position = self.game.screen_height * 0.45 + (row - 1) * self.item_spacing
+        first_x, first_y = slot_positions[0]
+        last_row = (self.max_inventory_slots - 1) // self.items_per_row
+        last_col = min(self.max_inventory_slots, self.items_per_row) - 1
 
+        self.game.ui.create_ui(
+            image_surface=self.inventory_grid_surface,
+            x=first_x + last_col * self.item_spacing / 2, y=first_y + last_row * self.item_spacing / 2,
+            centered=True,
+            width=self.inventory_grid_surface.get_width(), height=self.inventory_grid_surface.get_height(),
+            element_id="inventory_grid",
+            render_order=1
+        )
+
+        self.rendered_inventory_ui_elements.append("inventory_grid")
+
+        for slot, (x_position, y_position) in enumerate(slot_positions):
             slot_element_id = f"slot:{slot}"
 
             self.game.ui.create_ui(
-                sprite_sheet_path="assets/sprites/gui/ui.png", image_id=[34, 3],
-                x=x_position, y=y_position, sprite_width=32, sprite_height=32,
+                image_surface=self.slot_surface, visible=False,
+                x=x_position, y=y_position,
                 centered=True, width=35, height=35,
                 alpha=True, is_button=True,
                 element_id=slot_element_id,
@@ -611,37 +791,53 @@ class Player:
 
             self.rendered_inventory_ui_elements.append(slot_element_id)
 
+    def build_inventory_grid(self):
+        rows = (self.max_inventory_slots - 1) // self.items_per_row + 1
+        cols = min(self.max_inventory_slots, self.items_per_row)
+        slot_size = self.slot_surface.get_width()
+
+        self.inventory_grid_surface = pg.Surface(
+            ((cols - 1) * self.item_spacing + slot_size, (rows - 1) * self.item_spacing + slot_size),
+            pg.SRCALPHA
+        )
+
+        self.inventory_grid_surface.fblits([
+            (self.slot_surface, ((slot % self.items_per_row) * self.item_spacing, (slot // self.items_per_row) * self.item_spacing))
+            for slot in range(self.max_inventory_slots)
+        ])
+
+    def sync_ui_state(self):
+        # menu changes wipe every ui element, anything built once has to be rebuilt after that
+        if self.ui_clear_count == self.game.ui.clear_count:
+            return
+
+        self.ui_clear_count = self.game.ui.clear_count
+        self.inventory_ui_built = False
+        self.rendered_inventory_ui_elements.clear()
+        self.previous_health = None
+        self.heart_states = []
+        self.dialogue_shown_index = None
+
     def render_inventory(self):
         if self.in_inventory:
-            self.refresh_inventory()
+            # slots and icons persist as ui elements, only rebuild on first open or when something changed
+            if self.inventory_ui_built and not self.inventory_changed:
+                return
 
-            for item_slot, item in self.inventory.items():
-                row = item_slot // self.items_per_row
-                col = item_slot % self.items_per_row
-                    
-                x_position = self.game.screen_width * 0.5 - (2 * self.item_spacing + 1.6) + col * self.item_spacing
-                y_position = self.game.screen_height * 0.45 + (row - 1) * self.item_spacing
+            self.inventory_ui_built = True
+            self.refresh_inventory()
 
-                item_element_id = f"item:{item["name"]}"
-                item_data = self.item_info["items"][item["name"]]
-                tile_sheet = item_data.get("tile_sheet", ["assets/sprites/gui/items/Sheet.png", 16, 16])
+            for item_slot in self.inventory:
+                # the held item follows the mouse instead
+                if item_slot != self.selected_slot:
+                    self.show_inventory_item(item_slot)
 
-                self.game.ui.create_ui(
-                    image_id=item_data["index"],
-                    sprite_sheet_path=tile_sheet[0],
-                    sprite_width=tile_sheet[1], sprite_height=tile_sheet[2],
-                    x=x_position, y=y_position,
-                    centered=True, width=20, height=20,
-                    alpha=True, is_button=True,
-                    scale_multiplier=1,
-                    element_id=item_element_id,
-                    is_hold=False,
-                    render_order=1
-                )
+        else:
+            if not self.inventory_ui_built and not self.rendered_inventory_ui_elements:
+                return
 
-                self.rendered_inventory_ui_elements.append(item_element_id)
+            self.inventory_ui_built = False
 
-        else:
             for element_id in self.rendered_inventory_ui_elements:
                 self.game.ui.remove_ui_element(element_id)
 
@@ -651,36 +847,73 @@ class Player:
             if hasattr(self, "last_rendered_item") and self.last_rendered_item:
                 self.last_rendered_item = None
 
+    def show_inventory_item(self, slot):
+        item = self.inventory[slot]
+        row = slot // self.items_per_row
+        col = slot % self.items_per_row
+
+        x_position = self.game.screen_width * 0.5 - (2 * self.item_spacing + 1.6) + col * self.item_spacing
+        y_position = self.game.screen_height * 0.45 + (row - 1) * self.item_spacing
+
+        item_element_id = f"item:{item["name"]}"
+        item_data = self.item_info["items"][item["name"]]
+        tile_sheet = item_data.get("tile_sheet", ["assets/sprites/gui/items/Sheet.png", 16, 16])
+
+        self.game.ui.create_ui(
+            image_id=item_data["index"],
+            sprite_sheet_path=tile_sheet[0],
+            sprite_width=tile_sheet[1], sprite_height=tile_sheet[2],
+            x=x_position, y=y_position,
+            centered=True, width=20, height=20,
+            alpha=True, is_button=True,
+            scale_multiplier=1,
+            element_id=item_element_id,
+            is_hold=False,
+            render_order=1
+        )
+
+        if item_element_id not in self.rendered_inventory_ui_elements:
+            self.rendered_inventory_ui_elements.append(item_element_id)
+
+    def hide_inventory_item(self, slot):
+        item_element_id = f"item:{self.inventory[slot]["name"]}"
+        self.game.ui.remove_ui_element(item_element_id)
+
+        if item_element_id in self.rendered_inventory_ui_elements:
+            self.rendered_inventory_ui_elements.remove(item_element_id)
+
     def on_inventory_click(self, slot):
         if self.selected_slot is None and slot in self.inventory and (self.game.game_context.current_time - self.inventory_cooldown >= 150):
             self.selected_slot = slot
+            self.hide_inventory_item(slot)
             self.render_item_info(slot)
 
         elif self.selected_slot == slot and (self.game.game_context.current_time - self.inventory_cooldown >= 150):
             self.selected_slot = None
-            self.render_inventory()
+            self.show_inventory_item(slot)
             self.inventory_cooldown = self.game.game_context.current_time
 
-            drop_sound = random.choice(self.sounds["pickup"])
-            drop_sound["sound"].play()
+            random.choice(self.pickup_sounds).play()
 
         elif self.selected_slot is not None and slot != self.selected_slot and (self.game.game_context.current_time - self.inventory_cooldown >= 150):
-            if slot in self.inventory:
-                self.inventory[self.selected_slot], self.inventory[slot] = self.inventory[slot], self.inventory[self.selected_slot]
-
-            else:
-                self.inventory[slot] = self.inventory.pop(self.selected_slot)
+            self.move_inventory_slot(self.selected_slot, slot)
 
-            drop_sound = random.choice(self.sounds["pickup"])
-            drop_sound["sound"].play()
+            random.choice(self.pickup_sounds).play()
 
-            self.refresh_inventory()
+            # the next render_inventory rebuilds every slot from the new layout
             self.selected_slot = None
             self.inventory_changed = True
             self.inventory_cooldown = self.game.game_context.current_time
 
     def hitbox_set(self):
-        self.hitbox = pg.Rect(
+        # only touch the rect when x/y moved since the last call, collision and gravity both call this
+        position = (self.x, self.y)
+        if position == self.hitbox_position:
+            return
+
+        self.hitbox_position = position
+        # mutate the rects from load_settings in place, no new Rect every call
+        self.hitbox.update(
             self.x - self.hitbox_width / 2,
             self.y - self.hitbox_height / 2,
             self.hitbox_width,
@@ -688,7 +921,13 @@ class Player:
         )
 
     def interact_hitbox(self):
-        self.interact_radius = pg.Rect(
+        # standing still (dialogue, inventory, idle) leaves the rect as it was
+        position = (self.x, self.y)
+        if position == self.interact_position:
+            return
+
+        self.interact_position = position
+        self.interact_radius.update(
             self.x - self.hitbox_width / 2 - 50,
             self.y - self.hitbox_height / 2 - 50,
             self.hitbox_width + 100,
@@ -707,10 +946,12 @@ class Player:
                 self.game.ui.remove_ui_element("dialogue_boarder")
                 self.game.ui.remove_ui_element("dialogue_name")
 
-                for sound in self.sounds["talking"]:
-                    sound["sound"].stop()
+                for stop in self.talking_sound_stops:
+                    stop()
 
-            else:
+            elif self.dialogue_index != self.dialogue_shown_index:
+                # the ui types the text out on its own, only rebuild when the line changes
+                self.dialogue_shown_index = self.dialogue_index
                 message_text = messages[self.dialogue_index]
 
                 self.game.ui.create_ui(
@@ -750,16 +991,22 @@ class Player:
                 self.dialogue_just_opened = False
 
     def interact_with_entity(self):
+        # plain overlap test against the interact rect instead of a pg.Rect per entity
+        reach = self.interact_radius
+        reach_left, reach_right = reach.left, reach.right
+        reach_top, reach_bottom = reach.top, reach.bottom
+
         for entity in list(self.game.entities.entities):
-            entity_hitbox = pg.Rect(
-                entity["x"] - entity["width"] / 2,
-                entity["y"] - entity["height"] / 2,
-                entity["width"],
-                entity["height"]
+            half_width = entity["width"] / 2
+            half_height = entity["height"] / 2
+            entity_x = entity["x"]
+            entity_y = entity["y"]
+
+            is_interacting = (
+                entity_x - half_width < reach_right and entity_x + half_width > reach_left
+                and entity_y - half_height < reach_bottom and entity_y + half_height > reach_top
             )
 
-            is_interacting = self.interact_radius.colliderect(entity_hitbox)
-
             if entity["entity_type"] == "item":
                 if is_interacting:
                     if entity["type"] != "weapon":
@@ -775,10 +1022,10 @@ class Player:
 
                     self.game.entities.entities.remove(entity)
 
-                    for sound in self.sounds["pickup"]:
-                        sound["sound"].stop()
+                    for sound in self.pickup_sounds:
+                        sound.stop()
 
-                    random.choice(self.sounds["pickup"])["sound"].play()
+                    random.choice(self.pickup_sounds).play()
 
             elif entity["entity_type"] == "npc":
                 if not self.on_ground:
@@ -792,15 +1039,16 @@ class Player:
                     self.charging = False
                     self.dialogue_with = entity
                     self.dialogue_index = 0
+                    self.dialogue_shown_index = None
                     self.dialogue_just_opened = True
                     self.in_dialogue = True
 
                     self.direction = "left" if entity["x"] < self.x else "right"
 
-                    for sound in self.sounds["talking"]:
-                        sound["sound"].stop()
+                    for stop in self.talking_sound_stops:
+                        stop()
 
-                    random.choice(self.sounds["talking"])["sound"].play()
+                    random.choice(self.talking_sounds).play()
 
             elif entity["entity_type"] == "actor":
                 if entity.get("interactable", True) and (
@@ -820,16 +1068,15 @@ class Player:
             item_to_drop["quantity"] -= 1
 
         else:
-            del self.inventory[self.selected_slot]
+            self.remove_inventory_slot(self.selected_slot)
 
         self.game.entities.create_entity("item", item_to_drop["name"], self.x, self.y)
 
-        self.refresh_inventory()
+        # the next render_inventory rebuilds every slot from the new layout
         self.selected_slot = None
         self.inventory_changed = True
 
-        drop_sound = random.choice(self.sounds["pickup"])
-        drop_sound["sound"].play()
+        random.choice(self.pickup_sounds).play()
 
     def consume_item(self):
         if self.selected_slot is None or self.selected_slot not in self.inventory or self.inventory[self.selected_slot]["type"] != "consumable":
@@ -842,75 +1089,82 @@ class Player:
             item_to_consume["quantity"] -= 1
 
         else:
-            del self.inventory[self.selected_slot]
+            self.remove_inventory_slot(self.selected_slot)
 
-        self.refresh_inventory()
+        # the next render_inventory rebuilds every slot from the new layout
         self.selected_slot = None
         self.inventory_changed = True
 
-        consume_sound = random.choice(self.sounds["consume"])
-        consume_sound["sound"].play()
+        random.choice(self.consume_sounds).play()
 
     def jump(self):
         self.coyote_timer = 0
         self.vel_y = -self.jump_strength
-        jump_sound = random.choice(self.sounds["jump"])
-        jump_sound["sound"].play()
+        random.choice(self.jump_sounds).play()
 
         flip_offset = 11 if self.direction == "right" else 0
 
-        for amount in range(7):
-            vel_x = random.uniform(-1.0, 1.0)
-            vel_y = random.uniform(-1.0, -0.3)
-
-            radius = random.randint(2, 4)
-            smoke_img = self.smoke_images[random.choice([1, 2])]
-
-            pos_x = self.x + self.hitbox_width / 2 + random.uniform(-15, 15) - flip_offset
-            pos_y = self.y + self.hitbox_height / 2 + random.uniform(0, 7)
-
-            self.game.particles.generate(
-                pos=(pos_x, pos_y),
-                velocity=(vel_x, vel_y),
-                color=(255, 255, 255),
-                radius=radius,
-                lifespan=60,
-                fade=True,
-                image=smoke_img,
-                image_size=(radius * 2, radius * 2)
-            )
+        rng = self.rng
+        vel_x = rng.uniform(-1.0, 1.0, 7).tolist()
+        vel_y = rng.uniform(-1.0, -0.3, 7).tolist()
+        offset_x = rng.uniform(-15, 15, 7).tolist()
+        offset_y = rng.uniform(0, 7, 7).tolist()
+        radii = rng.integers(2, 5, 7).tolist()
+        variants = rng.integers(0, len(self.smoke_variants), 7).tolist()
+
+        base_x = self.x + self.hitbox_width / 2 - flip_offset
+        base_y = self.y + self.hitbox_height / 2
+
+        self.game.particles.generate_batch(
+            positions=[(base_x + offset_x[i], base_y + offset_y[i]) for i in range(7)],
+            velocities=list(zip(vel_x, vel_y)),
+            radii=radii,
+            images=[self.smoke_scaled[(self.smoke_variants[variant], radius)] for variant, radius in zip(variants, radii)],
+            lifespan=60,
+            fade=True
+        )
 
     def update_collision(self):
         self.hitbox_set()
 
-        horizontal_collisions = []
-        vertical_collisions = []
+        # only the deepest hit per axis matters, track it while scanning
+        best_horizontal = None
+        best_vertical = None
+        best_overlap_x = 0
+        best_overlap_y = 0
 
         self.blocked_horizontally = False
 
-        nearby_tiles = self.game.map.get_nearby_tiles(self.hitbox)
-
-        for tile_hitbox, tile_id in nearby_tiles:
-            tile_attributes = self.game.map.tile_attributes.get(tile_id, {})
-
-            swimmable = tile_attributes.get("swimmable", False)
-            damage = tile_attributes.get("damage", 0)
+        # no padding: the grid query already does the overlap test in C, so only touching tiles come back
+        nearby_tiles = self.game.map.get_nearby_tiles(self.hitbox, padding=0)
+        tile_swimmable = self.game.map.tile_swimmable
+        tile_damage = self.game.map.tile_damage
 
-            if self.hitbox.colliderect(tile_hitbox):
-                overlap_x = min(self.hitbox.right - tile_hitbox.left, tile_hitbox.right - self.hitbox.left)
-                overlap_y = min(self.hitbox.bottom - tile_hitbox.top, tile_hitbox.bottom - self.hitbox.top)
+        hitbox_left, hitbox_right = self.hitbox.left, self.hitbox.right
+        hitbox_top, hitbox_bottom = self.hitbox.top, self.hitbox.bottom
 
-                if overlap_x < overlap_y:
-                    horizontal_collisions.append((tile_hitbox, overlap_x, swimmable, damage))
+        # every tile here already overlaps the hitbox, so go straight to the penetration depths
+        for tile_hitbox, tile_id in nearby_tiles:
+            overlap_x = min(hitbox_right - tile_hitbox.left, tile_hitbox.right - hitbox_left)
+            overlap_y = min(hitbox_bottom - tile_hitbox.top, tile_hitbox.bottom - hitbox_top)
 
-                else:
-                    vertical_collisions.append((tile_hitbox, overlap_y, swimmable, damage))
+            if overlap_x < overlap_y:
+                if best_horizontal is None or overlap_x > best_overlap_x:
+                    best_horizontal = (tile_hitbox, overlap_x, tile_id)
+                    best_overlap_x = overlap_x
 
-        if horizontal_collisions:
-            tile_hitbox, overlap_x, swimmable, damage = max(horizontal_collisions, key=lambda t: t[1])
-            if not swimmable:
+            else:
+                if best_vertical is None or overlap_y > best_overlap_y:
+                    best_vertical = (tile_hitbox, overlap_y, tile_id)
+                    best_overlap_y = overlap_y
+
+        if best_horizontal:
+            # attributes are only needed for the tile that won on this axis
+            tile_hitbox, overlap_x, tile_id = best_horizontal
+            if not tile_swimmable[tile_id]:
                 self.blocked_horizontally = True
 
+                damage = tile_damage[tile_id]
                 if damage > 0:
                     self.take_damage(damage)
 
@@ -923,9 +1177,10 @@ class Player:
                 self.vel_x = 0
                 self.hitbox_set()
 
-        if vertical_collisions:
-            tile_hitbox, overlap_y, swimmable, damage = max(vertical_collisions, key=lambda t: t[1])
-            if not swimmable:
+        if best_vertical:
+            tile_hitbox, overlap_y, tile_id = best_vertical
+            if not tile_swimmable[tile_id]:
+                damage = tile_damage[tile_id]
                 if damage > 0:
                     self.take_damage(damage)
 
@@ -939,7 +1194,6 @@ class Player:
                 self.hitbox_set()
 
         self.actual_horizontal_movement = not self.blocked_horizontally and self.vel_x != 0
-        self.hitbox_set()
 
     def handle_gravity(self):
         self.on_ground = False
@@ -949,38 +1203,41 @@ class Player:
         bottom_middle_x = self.hitbox.centerx
         bottom_middle_y = self.hitbox.bottom
 
-        nearby_tiles = self.game.map.get_nearby_tiles(self.hitbox)
-        
+        game_map = self.game.map
+        # the foot point sits on the hitbox's bottom edge, 1px of padding is enough to reach the tile below
+        nearby_tiles = game_map.get_nearby_tiles(self.hitbox, padding=1)
+
+        # only the topmost tile under the feet decides what happens, find it first and evaluate it once
+        ground_hitbox = None
+        ground_id = None
         for tile_hitbox, tile_id in nearby_tiles:
             if tile_hitbox.collidepoint(bottom_middle_x, bottom_middle_y):
-                tile_attributes = self.game.map.tile_attributes.get(tile_id, {})
+                if ground_hitbox is None or tile_hitbox.top < ground_hitbox.top:
+                    ground_hitbox = tile_hitbox
+                    ground_id = tile_id
 
-                swimmable = tile_attributes.get("swimmable", False)
-                slippy = tile_attributes.get("slippy", False)
-                friction = tile_attributes.get("friction", 0)
-                damage = tile_attributes.get("damage", 0)
+        if ground_hitbox is not None:
+            if game_map.tile_swimmable[ground_id]:
+                self.vel_y *= 0.8
+                self.on_ground = True
 
-                if swimmable:
-                    self.vel_y *= 0.8
-                    self.on_ground = True
-                    continue
-
-                if slippy:
-                    self.friction = friction
+            else:
+                if game_map.tile_slippy[ground_id]:
+                    self.friction = game_map.tile_friction[ground_id]
                     self.sliding = True
                     
                 else:
                     self.friction = 0
                     self.sliding = False
 
+                damage = game_map.tile_damage[ground_id]
                 if damage > 0:
                     self.take_damage(damage)
 
                 if self.vel_y >= 1.5:
-                    self.y = tile_hitbox.top - self.hitbox.height / 2
+                    self.y = ground_hitbox.top - self.hitbox.height / 2
                     self.vel_y = 0
                     self.on_ground = True
-                    break
         
         if self.on_ground or self.vel_y < 0:
             if self.on_ground:
@@ -1007,7 +1264,7 @@ class Player:
         previous_state = self.current_state
         
         if self.current_state == "death":
-            frame_delay = int(1 / self.state_frames["death"]["speed"])
+            frame_delay = self.state_frame_delays["death"]
             self.animation_timer += 1
 
             if self.current_frame < len(self.frames["death"]) - 1:
@@ -1017,7 +1274,7 @@ class Player:
             return
 
         if self.current_state == "hurt":
-            frame_delay = int(1 / self.state_frames["hurt"]["speed"])
+            frame_delay = self.state_frame_delays["hurt"]
             self.animation_timer += 1
 
             if self.animation_timer >= frame_delay:
@@ -1029,6 +1286,9 @@ class Player:
                     self.current_frame = 0
             return
         
+        # set alongside current_state so advance_frame doesnt have to prefix-match the state name
+        self.attack_state = self.attacking
+
         if self.attacking:
             self.current_state = f"attacking{self.equipped_weapon}{self.attack_sequence}"
             
@@ -1045,7 +1305,7 @@ class Player:
         self.advance_frame()
 
     def advance_frame(self):
-        if self.current_state.startswith("attacking"):
+        if self.attack_state:
             weapon_data = self.weapon_info.get(self.equipped_weapon)
             if not weapon_data:
                 self.attacking = False
@@ -1054,12 +1314,12 @@ class Player:
             if self.charging:
                 return
 
-            frame_delay = int(1 / weapon_data["speed"])
+            frame_delay = self.weapon_frame_delays[self.equipped_weapon]
             frames_for_attack = weapon_data["frames"][self.attack_sequence - 1]
 
         else:
-            frame_delay = int(1 / self.state_frames[self.current_state]["speed"])
-            frames_for_attack = self.state_frames[self.current_state]["frames"]
+            frame_delay = self.state_frame_delays[self.current_state]
+            frames_for_attack = self.state_frame_counts[self.current_state]
 
         self.animation_timer += 1
         if self.animation_timer < frame_delay:
@@ -1068,8 +1328,7 @@ class Player:
         self.animation_timer = 0
         self.current_frame = (self.current_frame + 1) % frames_for_attack
 
-        if self.current_state.startswith("attacking"):
-            weapon_data = self.weapon_info.get(self.equipped_weapon, {})
+        if self.attack_state:
             is_ranged = weapon_data.get("type") in ("ranged", "instant_ranged")
             if not is_ranged and self.current_frame == frames_for_attack - 1:
                 self.attacking = False
@@ -1082,26 +1341,9 @@ class Player:
         mouse_buttons = pg.mouse.get_pressed()
         self.joystick = self.game.game_context.joystick
 
-        controller = {}
+        controller = self.controller
         if self.joystick:
-            controller = {
-                "left_x": self.joystick.get_axis(0) if abs(self.joystick.get_axis(0)) > 0.1 else 0,
-                "left_y": self.joystick.get_axis(1) if abs(self.joystick.get_axis(1)) > 0.1 else 0,
-                "A": self.joystick.get_button(0),
-                "B": self.joystick.get_button(1),
-                "X": self.joystick.get_button(2),
-                "Y": self.joystick.get_button(3),
-                "LB": self.joystick.get_button(4),
-                "RB": self.joystick.get_button(5),
-                "back": self.joystick.get_button(6),
-                "start": self.joystick.get_button(7)
-            }
-
-            if self.joystick.get_numhats() > 0:
-                controller["dpad"] = self.joystick.get_hat(0)
-                
-            else:
-                controller["dpad"] = (0, 0)
+            controller.update(self.joystick)
 
         if self.current_state == "death":
             return
@@ -1133,10 +1375,10 @@ class Player:
                 self.vel_x = 0
                 #self.vel_y = 0
 
-        if keys[pg.K_q] or (self.joystick and controller.get("X")):
+        if keys[pg.K_q] or (self.joystick and controller.X):
             self.drop_item()
 
-        if keys[pg.K_e] or (self.joystick and controller.get("A")):
+        if keys[pg.K_e] or (self.joystick and controller.A):
             self.consume_item()
         
     def handle_normal_controls(self, keys, mouse_buttons, controller, in_knockback=False):
@@ -1145,15 +1387,15 @@ class Player:
             return
 
         if in_knockback:
-            jump_input = keys[pg.K_w] or (self.joystick and controller.get("A"))
+            jump_input = keys[pg.K_w] or (self.joystick and controller.A)
             if jump_input and self.coyote_timer > 0:
                 self.jump()
             
-            interact_input = keys[pg.K_e] or (self.joystick and controller.get("Y"))
+            interact_input = keys[pg.K_e] or (self.joystick and controller.Y)
             if interact_input and not self.in_map:
                 self.interact_with_entity()
             
-            attack_input = keys[pg.K_SPACE] or (self.joystick and controller.get("B"))
+            attack_input = keys[pg.K_SPACE] or (self.joystick and controller.B)
             if self.current_state != "hurt":
                 self.handle_weapon_input(attack_input)
                 
@@ -1167,47 +1409,53 @@ class Player:
             self.knockback_timer -= 1
             return 
     
-        left_input = keys[pg.K_a] or (self.joystick and controller.get("left_x") < -0.5)
-        right_input = keys[pg.K_d] or (self.joystick and controller.get("left_x") > 0.5)
+        left_input = bool(keys[pg.K_a] or (self.joystick and controller.left_x < -0.5))
+        right_input = bool(keys[pg.K_d] or (self.joystick and controller.left_x > 0.5))
 
-        if getattr(self, "sliding", False):
-            if left_input and not right_input and not self.blocked_horizontally:
-                self.vel_x = -self.speed
-                self.direction = "left"
+        sign, direction = self.movement_table[(left_input, right_input, getattr(self, "sliding", False), self.blocked_horizontally)]
 
-            elif right_input and not left_input and not self.blocked_horizontally:
-                self.vel_x = self.speed
-                self.direction = "right"
+        if sign is not None:
+            self.vel_x = sign * self.speed
 
-        else:
-            if left_input and right_input:
-                self.vel_x = 0
+        if direction:
+            self.direction = direction
 
-            elif left_input and not self.blocked_horizontally:
-                self.vel_x = -self.speed
-                self.direction = "left"
+    def resolve_movement(self, left_input, right_input, sliding, blocked):
+        # (vel_x sign, new direction), sign None leaves vel_x alone
+        if sliding:
+            if left_input and not right_input and not blocked:
+                return -1, "left"
 
-            elif right_input and not self.blocked_horizontally:
-                self.vel_x = self.speed
-                self.direction = "right"
+            elif right_input and not left_input and not blocked:
+                return 1, "right"
 
-            else:
-                self.vel_x = 0
+            return None, None
+
+        if left_input and right_input:
+            return 0, None
+
+        elif left_input and not blocked:
+            return -1, "left"
+
+        elif right_input and not blocked:
+            return 1, "right"
+
+        return 0, None
 
     def handle_actions(self, keys, mouse_buttons, controller):
-        jump_input = keys[pg.K_w] or (self.joystick and controller.get("A"))
+        jump_input = keys[pg.K_w] or (self.joystick and controller.A)
         if jump_input and self.coyote_timer > 0:
             self.jump()
 
-        interact_input = keys[pg.K_e] or (self.joystick and controller.get("Y"))
+        interact_input = keys[pg.K_e] or (self.joystick and controller.Y)
         if interact_input and not self.in_map:
             self.interact_with_entity()
 
-        attack_input = keys[pg.K_SPACE] or (self.joystick and controller.get("B"))
+        attack_input = keys[pg.K_SPACE] or (self.joystick and controller.B)
         if self.current_state != "hurt":
             self.handle_weapon_input(attack_input)
 
-        pause_input = keys[pg.K_ESCAPE] or (self.joystick and controller.get("start"))
+        pause_input = keys[pg.K_ESCAPE] or (self.joystick and controller.start)
         if pause_input:
             pass
 
@@ -1227,8 +1475,8 @@ class Player:
                     self.equip_weapon(weapon_to_equip)
                     break
         
-        if self.joystick and controller:
-            dpad = controller.get("dpad", (0, 0))
+        if self.joystick:
+            dpad = controller.dpad
             
             if dpad[0] < 0:
                 current_index = self.weapon_inventory.index(self.equipped_weapon) if self.equipped_weapon in self.weapon_inventory else 0
@@ -1459,8 +1707,7 @@ class Player:
             get_facing_direction=lambda: 1 if self.direction == "right" else -1,
         )
 
-        attack_sound = random.choice(self.sounds["attack"])
-        attack_sound["sound"].play()
+        random.choice(self.attack_sounds).play()
 
     def equip_weapon(self, weapon_name):
         self.cancel_charge()
@@ -1543,39 +1790,42 @@ class Player:
                 self.game.ui.remove_ui_element("dialogue_boarder")
                 self.dialogue_index += 1
 
-                for sound in self.sounds["talking"]:
-                    sound["sound"].stop()
+                for stop in self.talking_sound_stops:
+                    stop()
 
-                talk_sound = random.choice(self.sounds["talking"])
-                talk_sound["sound"].play()
+                random.choice(self.talking_sounds).play()
 
             else:
                 self.dialogue_just_opened = False
 
     def handle_gameplay_input(self, event, button_pressed, button):
-        if (event.type == pg.KEYDOWN and event.key == pg.K_i) or (button_pressed and button == 6):
-            if not self.in_map:
-                self.in_inventory = not self.in_inventory
+        action = self.button_actions.get(button) if button_pressed else self.key_actions.get(event.key)
+        if action:
+            action()
 
-                if self.in_inventory:
-                    self.sounds["inventory"]["open"]["sound"].play()
+    def toggle_inventory(self):
+        if not self.in_map:
+            self.in_inventory = not self.in_inventory
 
-                else:
-                    self.sounds["inventory"]["close"]["sound"].play()
+            if self.in_inventory:
+                self.sounds["inventory"]["open"]["sound"].play()
 
-        if (event.type == pg.KEYDOWN and event.key == pg.K_t) or (button_pressed and button == 5):
-            if not self.in_inventory:
-                self.in_map = not self.in_map
+            else:
+                self.sounds["inventory"]["close"]["sound"].play()
 
-                if self.in_map:
-                    self.sounds["inventory"]["open"]["sound"].play()
+    def toggle_map(self):
+        if not self.in_inventory:
+            self.in_map = not self.in_map
 
-                else:
-                    self.sounds["inventory"]["close"]["sound"].play()
+            if self.in_map:
+                self.sounds["inventory"]["open"]["sound"].play()
 
-        if (event.type == pg.KEYDOWN and event.key == pg.K_LSHIFT) or (button_pressed and button == 4):
-            if not self.in_inventory:
-                self.dash()
+            else:
+                self.sounds["inventory"]["close"]["sound"].play()
+
+    def try_dash(self):
+        if not self.in_inventory:
+            self.dash()
 
     def handle_button_up(self, event):
         if ((event.type == pg.KEYUP and event.key == pg.K_e) or (event.type == pg.JOYBUTTONUP and event.button == 3)):
@@ -1590,23 +1840,13 @@ class Player:
         num_ghosts = 4
         step_size = distance / num_ghosts
 
+        ghost_images = self.get_ghost_images(self.current_state, self.current_frame, self.direction, num_ghosts)
+
         for ghost in range(num_ghosts):
             ghost_x = start_x + (step_size * ghost * dash_dir)
             ghost_y = self.y - 5
 
-            current_frame_image = self.frames[self.current_state][self.current_frame]
-
-            if self.direction == "left":
-                current_frame_image = pg.transform.flip(current_frame_image, True, False)
-
-            white_image = current_frame_image.copy()
-
-            white_surface = pg.Surface(white_image.get_size(), pg.SRCALPHA)
-            white_surface.fill((255, 255, 255, 255))
-            white_image.blit(white_surface, (0, 0), special_flags=pg.BLEND_MULT)
-
-            opacity = int(255 * ((ghost + 1) / num_ghosts))
-            white_image.fill((255, 255, 255, opacity), special_flags=pg.BLEND_RGBA_MULT)
+            white_image = ghost_images[ghost]
 
             flip_offset = 14 if self.direction == "right" else 0
 
@@ -1620,10 +1860,32 @@ class Player:
                 radius=(self.hitbox_width, self.hitbox_height),
                 lifespan=lifespan,
                 fade=True,
-                image=white_image,
-                image_size=white_image.get_size()
+                image=white_image
             )
 
+    def get_ghost_images(self, state, frame_index, direction, num_ghosts):
+        # silhouettes only depend on the frame, build each opacity step once and let particles copy them
+        key = (state, frame_index, direction)
+        ghost_images = self.ghost_images.get(key)
+        if ghost_images is not None:
+            return ghost_images
+
+        silhouette = self.get_frame(state, frame_index, direction).copy()
+
+        white_surface = pg.Surface(silhouette.get_size(), pg.SRCALPHA)
+        white_surface.fill((255, 255, 255, 255))
+        silhouette.blit(white_surface, (0, 0), special_flags=pg.BLEND_MULT)
+
+        ghost_images = []
+        for ghost in range(num_ghosts):
+            opacity = int(255 * ((ghost + 1) / num_ghosts))
+            ghost_image = silhouette.copy()
+            ghost_image.fill((255, 255, 255, opacity), special_flags=pg.BLEND_RGBA_MULT)
+            ghost_images.append(ghost_image)
+
+        self.ghost_images[key] = ghost_images
+        return ghost_images
+
     def dash(self):
         current_time = self.game.game_context.current_time
 
@@ -1633,48 +1895,52 @@ class Player:
         dash_dir = 1 if self.direction == "right" else -1
         dash_distance = self.dash_speed
 
-        steps = 20
-        step_size = dash_distance / steps
-
         start_x = self.x
-        final_x = self.x
-        blocked = False
+        half_width = self.hitbox_width / 2
+        top = self.y - self.hitbox_height / 2
 
-        for segment in range(1, steps + 1):
-            test_x = self.x + (step_size * segment * dash_dir)
+        # sweep the hitbox over the whole dash at once and stop at the first solid tile edge in the way
+        path_left = min(start_x, start_x + dash_distance * dash_dir) - half_width
+        path_hitbox = pg.Rect(path_left, top, self.hitbox_width + dash_distance, self.hitbox_height)
 
-            temp_hitbox = pg.Rect(
-                test_x - self.hitbox_width / 2,
-                self.y - self.hitbox_height / 2,
-                self.hitbox_width,
-                self.hitbox_height
-            )
+        # tile edges are whole pixels, so sweep from the rect edge rather than the float x
+        self.hitbox_set()
+        front_edge = self.hitbox.right if dash_dir == 1 else self.hitbox.left
+        reach = front_edge + dash_distance * dash_dir
 
-            nearby_tiles = self.game.map.get_nearby_tiles(temp_hitbox)
-            
-            for tile_hitbox, tile_id in nearby_tiles:
-                tile_attributes = self.game.map.tile_attributes.get(tile_id, {})
-                swimmable = tile_attributes.get("swimmable", False)
-                
-                if temp_hitbox.colliderect(tile_hitbox) and not swimmable:
-                    blocked = True
-                    break
+        tile_swimmable = self.game.map.tile_swimmable
+
+        for tile_hitbox, tile_id in self.game.map.get_nearby_tiles(path_hitbox):
+            if tile_hitbox.top >= path_hitbox.bottom or tile_hitbox.bottom <= path_hitbox.top:
+                continue
+
+            if dash_dir == 1:
+                if tile_hitbox.right <= front_edge or tile_hitbox.left >= reach:
+                    continue
+
+                if tile_swimmable[tile_id]:
+                    continue
+
+                reach = max(tile_hitbox.left, front_edge)
+
+            else:
+                if tile_hitbox.left >= front_edge or tile_hitbox.right <= reach:
+                    continue
 
-            if blocked:
-                break
+                if tile_swimmable[tile_id]:
+                    continue
 
-            final_x = test_x
+                reach = min(tile_hitbox.right, front_edge)
 
-        distance_traveled = abs(final_x - start_x)
+        distance_traveled = abs(reach - front_edge)
 
-        if distance_traveled > 0:
-            self.x = final_x
+        if distance_traveled >= 1:
+            self.x = start_x + distance_traveled * dash_dir
             self.last_dash_time = current_time
 
             self.dash_visuals(start_x, distance_traveled)
 
-            dash_sound = random.choice(self.sounds["dash"])
-            dash_sound["sound"].play()
+            random.choice(self.dash_sounds).play()
 
     def render_charge_bar(self):
         if not self.game.game_context.show_indicators:
@@ -1709,24 +1975,19 @@ class Player:
             pg.draw.rect(self.game.screen, color, (bar_x, bar_y, filled_width, bar_height))
 
     def render(self):
-        self.flip_offset = {"left": 1.4, "right": 0}
-        self.foot_alignment = 3
-        
-        if (self.current_state not in self.frames or
-            not self.frames[self.current_state] or
-            (self.game.game_context.current_time - self.last_damage_time < self.invinsibility_duration and
-            not self.current_state == "death" and (self.game.game_context.current_time // 100) % 2 == 0)):
+        state_frames = self.frames.get(self.current_state)
+        if not state_frames:
+            return
+
+        # the flicker phase only matters inside the invincibility window
+        current_time = self.game.game_context.current_time
+        if (current_time - self.last_damage_time < self.invinsibility_duration and
+            self.current_state != "death" and (current_time // 100) & 1 == 0):
             return
 
-        frame_idx = min(self.current_frame, len(self.frames[self.current_state]) - 1)
+        frame_idx = min(self.current_frame, len(state_frames) - 1)
         
-        if hasattr(self, "flipped_frames"):
-            image = (self.flipped_frames[self.current_state][frame_idx] if self.direction == "left" else self.frames[self.current_state][frame_idx])
-            
-        else:
-            image = self.frames[self.current_state][frame_idx]
-            if self.direction == "left":
-                image = pg.transform.flip(image, True, False)
+        image = self.get_frame(self.current_state, frame_idx, self.direction)
 
         img_w, img_h = image.get_size()
         cam_x, cam_y = self.game.camera.x, self.game.camera.y
@@ -1747,27 +2008,38 @@ class Player:
     def update_camera(self):
         self.game.camera.update()
 
+    def get_debug_surface(self, width, height, color):
+        key = (width, height, color)
+        surface = self.debug_surfaces.get(key)
+        if surface is None:
+            surface = pg.Surface((width, height), pg.SRCALPHA)
+            surface.fill(color)
+            self.debug_surfaces[key] = surface
+
+        return surface
+
     def render_hitboxes(self):
         if not self.game.debugging:
             return
 
-        interact_color = (0, 0, 255, 50)
-        interact_surface = pg.Surface((self.interact_radius.width, self.interact_radius.height), pg.SRCALPHA)
-        interact_surface.fill(interact_color)
-        self.game.screen.blit(
+        screen = self.game.screen
+        cam_x, cam_y = self.game.camera.x, self.game.camera.y
+        interact_radius = self.interact_radius
+
+        # sizes and colors never change between frames, the tinted overlays are built once
+        interact_surface = self.get_debug_surface(interact_radius.width, interact_radius.height, (0, 0, 255, 50))
+        screen.blit(
             interact_surface,
             (
-                self.interact_radius.centerx - self.game.camera.x - self.interact_radius.width // 2,
-                self.interact_radius.centery - self.game.camera.y - self.interact_radius.height // 2
+                interact_radius.centerx - cam_x - interact_radius.width // 2,
+                interact_radius.centery - cam_y - interact_radius.height // 2
             )
         )
 
-        hitbox_color = (0, 255, 0, 100)
-        hitbox_surface = pg.Surface((self.hitbox_width, self.hitbox_height), pg.SRCALPHA)
-        hitbox_surface.fill(hitbox_color)
-        self.game.screen.blit(
+        hitbox_surface = self.get_debug_surface(self.hitbox_width, self.hitbox_height, (0, 255, 0, 100))
+        screen.blit(
             hitbox_surface,
-            (self.hitbox.x - self.game.camera.x, self.hitbox.y - self.game.camera.y)
+            (self.hitbox.x - cam_x, self.hitbox.y - cam_y)
         )
     
     def render_map(self):
@@ -1822,12 +2094,7 @@ class Player:
             tile_rect = tile_surface.get_rect(center=(tile_pixel_x, tile_pixel_y))
             self.map_surface.blit(tile_surface, tile_rect)
         
-        map_bg_element = None
-        
-        for element in self.game.ui.ui_elements:
-            if element.get("id") == "map_bg":
-                map_bg_element = element
-                break
+        map_bg_element = self.game.ui.ui_elements_by_id.get("map_bg")
         
         if map_bg_element:
             map_bg_element["original_image"] = self.map_surface
@@ -1843,7 +2110,7 @@ class Player:
                 "alpha": True,
                 "is_button": False
             }
-            self.game.ui.ui_elements.append(map_bg_element)
+            self.game.ui.add_ui_element(map_bg_element)
         
         if len(cached_tiles) > 1000:
             self.cached_tile_surfaces = {}
@@ -1873,7 +2140,7 @@ class Player:
             "layer": tile_data.get("layer", 0)
         }
 
-        self.game.ui.ui_elements.append(new_tile_element)
+        self.game.ui.add_ui_element(new_tile_element)
 
     def update_map_tile(self, element_data, tile_data, center_pixel_x, center_pixel_y, tile_pixel_size):
         tile_pixel_x = center_pixel_x + tile_data.get("x", 0) * tile_pixel_size
@@ -1943,6 +2210,7 @@ class Player:
             self.update_collision()
             self.interact_hitbox()
             self.animate()
+            self.sync_ui_state()
             self.render_inventory()
             self.render_map()
             self.update_pickup_tags()
@@ -95,6 +95,12 @@ class ProjectileSystem:
         self.flipped_cache_keys = []
         self.flipped_cache_max = 128
 
+        # rotate_to_velocity angles are snapped to this step so rotated frames can be shared
+        self.rotated_cache = {}
+        self.rotated_cache_keys = []
+        self.rotated_cache_max = 360
+        self.rotation_step = 3
+
         self.swimmable_tile_ids = set()
         self.swimmable_dirty = True
 
@@ -125,6 +131,14 @@ class ProjectileSystem:
         self.flipped_cache[key] = image
         self.flipped_cache_keys.append(key)
 
+    def cache_rotated_image(self, key, image):
+        if len(self.rotated_cache) >= self.rotated_cache_max:
+            oldest_key = self.rotated_cache_keys.pop(0)
+            self.rotated_cache.pop(oldest_key, None)
+
+        self.rotated_cache[key] = image
+        self.rotated_cache_keys.append(key)
+
     def get_flipped_image(self, image, should_flip):
         if not should_flip:
             return image
@@ -465,6 +479,9 @@ class ProjectileSystem:
         camera_y = game.camera.y
         scaled_cache = self.scaled_cache
         flipped_cache = self.flipped_cache
+        rotated_cache = self.rotated_cache
+        rotation_step = self.rotation_step
+        rotation_bins = 360 // rotation_step
 
         half_w = game.screen_width // 2
         half_h = game.screen_height // 2
@@ -518,27 +535,36 @@ class ProjectileSystem:
             if projectile.rotate_to_velocity:
                 rotation = projectile.rotation
                 if rotation != 0:
+                    angle_bin = round(rotation / rotation_step) % rotation_bins
                     if (projectile.cached_image is not None and
-                            projectile.cached_rotation == rotation and
+                            projectile.cached_rotation == angle_bin and
                             projectile.cached_flip == should_flip):
                         image = projectile.cached_image
                         
                     else:
-                        if should_flip:
-                            flip_key = (id(image), True, False)
-                            if flip_key in flipped_cache:
-                                flipped = flipped_cache[flip_key]
-                                
-                            else:
-                                flipped = pg.transform.flip(image, True, False)
-                                self.cache_flipped_image(flip_key, flipped)
-                            image = pg.transform.rotate(flipped, -rotation)
+                        rotated_key = (id(image), should_flip, angle_bin)
+                        if rotated_key in rotated_cache:
+                            rotated = rotated_cache[rotated_key]
                             
                         else:
-                            image = pg.transform.rotate(image, -rotation)
+                            if should_flip:
+                                flip_key = (id(image), True, False)
+                                if flip_key in flipped_cache:
+                                    flipped = flipped_cache[flip_key]
+                                    
+                                else:
+                                    flipped = pg.transform.flip(image, True, False)
+                                    self.cache_flipped_image(flip_key, flipped)
+                                rotated = pg.transform.rotate(flipped, -angle_bin * rotation_step)
+                                
+                            else:
+                                rotated = pg.transform.rotate(image, -angle_bin * rotation_step)
+                                
+                            self.cache_rotated_image(rotated_key, rotated)
                             
+                        image = rotated
                         projectile.cached_image = image
-                        projectile.cached_rotation = rotation
+                        projectile.cached_rotation = angle_bin
                         projectile.cached_flip = should_flip
 
                     hitbox_cx = rect.centerx - camera_x
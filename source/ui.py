@@ -1,4 +1,5 @@
 import pygame as pg
+import math
 import re
 
 class UI:
@@ -6,12 +7,14 @@ class UI:
         self.game = game
         
         self.ui_elements = []
+        self.ui_elements_by_id = {} # id lookups without scanning the element list
         self.loaded_sheets = {}
         self.loaded_images = {}
         self.loaded_fonts = {}
         self.loaded_sounds = {}
         
         self.mouse_locked = False
+        self.clear_count = 0 # lets systems that keep elements alive know when theyve been wiped
 
     def build_element_from_config(self, cfg, game_context):
         element_type = cfg.get("type")
@@ -321,16 +324,22 @@ class UI:
                     is_slider=False, min_value=0, max_value=100, initial_value=50, step_size=1, variable=None,
                     is_dialogue=False, typing_speed=30, auto_advance=False, advance_speed=2000,
                     parallax_factor=None, follow_factor=None, hover_range=None, dynamic_value=None,
-                    click_sound=None, release_sound=None):
+                    click_sound=None, release_sound=None, image_surface=None, visible=True):
         
         try:
-            if any(el["id"] == element_id for el in self.ui_elements):
+            if element_id in self.ui_elements_by_id:
                 return  
 
             original_image = None
             missing_texture = False
 
-            if image_path:
+            if image_surface:
+                # pre-baked by the caller, shared between elements and never drawn on
+                original_image = image_surface
+                if original_image.get_size() != (width, height):
+                    original_image = pg.transform.scale(original_image, (width, height))
+
+            elif image_path:
                 original_image = self.load_image(image_path, alpha)
                 if original_image == self.game.game_context.missing_texture:
                     missing_texture = True
@@ -455,6 +464,7 @@ class UI:
                 "dynamic_value": dynamic_value,
                 "click_sound": click_sound,
                 "release_sound": release_sound,
+                "visible": visible, # hidden elements still take input, something else draws them
             }
 
             if centered:
@@ -467,17 +477,29 @@ class UI:
                 ui_element["text_rect"] = text_surface.get_rect(center=ui_element["rect"].center)
 
             if original_image:
-                ui_element["image"] = ui_element["original_image"].copy()
+                ui_element["image"] = original_image if image_surface else original_image.copy()
                 ui_element["center"] = (ui_element["rect"].centerx, ui_element["rect"].centery)
 
-            self.ui_elements.append(ui_element)
+            self.add_ui_element(ui_element)
 
         except Exception as e:
             print(f"Error creating UI element {element_id}: {e}")
 
+    def add_ui_element(self, element):
+        self.ui_elements.append(element)
+        self.ui_elements_by_id[element["id"]] = element
+
     def remove_ui_element(self, element_id):
+        if self.ui_elements_by_id.pop(element_id, None) is None:
+            return
+        
         self.ui_elements = [el for el in self.ui_elements if el["id"] != element_id]
 
+    def clear_ui_elements(self):
+        self.ui_elements.clear()
+        self.ui_elements_by_id.clear()
+        self.clear_count += 1
+
     def clear_all_cache(self):
         self.loaded_sheets.clear()
         self.loaded_images.clear()
@@ -554,8 +576,6 @@ class UI:
             direction_x = mouse_pos[0] - element_center_x
             direction_y = mouse_pos[1] - element_center_y
             
-            distance = max(1, (direction_x ** 2 + direction_y ** 2) ** 0.5)
-            
             offset_x += direction_x * element["follow_factor"]
             offset_y += direction_y * element["follow_factor"]
         
@@ -563,7 +583,7 @@ class UI:
             cx, cy = element["rect"].center
             dx = mouse_pos[0] - cx
             dy = mouse_pos[1] - cy
-            dist = (dx * dx + dy * dy) ** 0.5
+            dist = math.hypot(dx, dy)
 
             hover_radius = max(element["rect"].width, element["rect"].height) * 0.5
 
@@ -726,33 +746,62 @@ class UI:
         element["slider_knob"] = knob_rect
     
     def reset_ui_position(self, element_id):
-        for element in self.ui_elements:
-            if element["id"] == element_id:
-                element["current_offset"] = (0, 0)
-                
-                if element["centered"]:
-                    element["rect"] = element["original_image"].get_rect(
-                        center=element["base_position"]
-                    ) if element["original_image"] else pg.Rect(
-                        element["base_position"][0] - element["width"]/2,
-                        element["base_position"][1] - element["height"]/2,
-                        element["width"], element["height"]
-                    )
-                    
-                else:
-                    element["rect"] = pg.Rect(
-                        element["base_position"][0],
-                        element["base_position"][1],
-                        element["width"], element["height"]
-                    )
-    
-                if "text_rect" in element:
-                    element["text_rect"] = element["text_surface"].get_rect(center=element["rect"].center)
-                    
-                break
+        element = self.ui_elements_by_id.get(element_id)
+        if not element:
+            return
+
+        element["current_offset"] = (0, 0)
+        
+        if element["centered"]:
+            element["rect"] = element["original_image"].get_rect(
+                center=element["base_position"]
+            ) if element["original_image"] else pg.Rect(
+                element["base_position"][0] - element["width"]/2,
+                element["base_position"][1] - element["height"]/2,
+                element["width"], element["height"]
+            )
+            
+        else:
+            element["rect"] = pg.Rect(
+                element["base_position"][0],
+                element["base_position"][1],
+                element["width"], element["height"]
+            )
+
+        if "text_rect" in element:
+            element["text_rect"] = element["text_surface"].get_rect(center=element["rect"].center)
+
+    def update_ui_position(self, element_id, x, y):
+        element = self.ui_elements_by_id.get(element_id)
+        if not element:
+            return
+
+        element["base_position"] = (x, y)
+        offset_x, offset_y = element["current_offset"]
+
+        if element["centered"]:
+            element["rect"] = element["image"].get_rect(
+                center=(x + offset_x, y + offset_y)
+            ) if element["original_image"] else pg.Rect(
+                x + offset_x - element["width"]/2,
+                y + offset_y - element["height"]/2,
+                element["width"], element["height"]
+            )
+            
+        else:
+            element["rect"] = pg.Rect(x + offset_x, y + offset_y, element["width"], element["height"])
+
+        if "center" in element:
+            element["center"] = element["rect"].center
+
+        if "text_rect" in element:
+            element["text_rect"] = element["text_surface"].get_rect(center=element["rect"].center)
+
+        if "scaled_text_rect" in element:
+            element["scaled_text_rect"] = element["scaled_text_surface"].get_rect(center=element["rect"].center)
 
     def render_ui_element(self, element):
-        if element["original_image"]:
+        if element["original_image"] and element.get("visible", True):
             self.game.screen.blit(element["image"], element["rect"])
 
         if element.get("text_surface"):
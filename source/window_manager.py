@@ -102,11 +102,14 @@ class WindowManager:
         gl.glEnableVertexAttribArray(pos_loc)
         gl.glVertexAttribPointer(tex_loc, 2, gl.GL_FLOAT, False, 16, gl.ctypes.c_void_p(8))
         gl.glEnableVertexAttribArray(tex_loc)
+        # program and vao stay bound for the lifetime of the context
 
         self.screen_texture = gl.glGenTextures(1)
         gl.glBindTexture(gl.GL_TEXTURE_2D, self.screen_texture)
         gl.glTexParameteri(gl.GL_TEXTURE_2D, gl.GL_TEXTURE_MIN_FILTER, gl.GL_LINEAR)
         gl.glTexParameteri(gl.GL_TEXTURE_2D, gl.GL_TEXTURE_MAG_FILTER, gl.GL_LINEAR)
+        # allocate storage once, frames only overwrite the pixels
+        gl.glTexImage2D(gl.GL_TEXTURE_2D, 0, gl.GL_RGBA, self.screen_width, self.screen_height, 0, gl.GL_RGBA, gl.GL_UNSIGNED_BYTE, None)
 
     def draw_scaled(self):
         if not self.use_opengl:
@@ -114,9 +117,7 @@ class WindowManager:
             
         screen_data = pg.image.tobytes(self.screen, "RGBA", True)
         gl.glBindTexture(gl.GL_TEXTURE_2D, self.screen_texture)
-        gl.glTexImage2D(gl.GL_TEXTURE_2D, 0, gl.GL_RGBA, self.screen_width, self.screen_height, 0, gl.GL_RGBA, gl.GL_UNSIGNED_BYTE, screen_data)
+        gl.glTexSubImage2D(gl.GL_TEXTURE_2D, 0, 0, 0, self.screen_width, self.screen_height, gl.GL_RGBA, gl.GL_UNSIGNED_BYTE, screen_data)
         gl.glClearColor(0, 0, 0, 1)
         gl.glClear(gl.GL_COLOR_BUFFER_BIT)
-        gl.glUseProgram(self.shader_program)
-        gl.glBindVertexArray(self.vao)
         gl.glDrawElements(gl.GL_TRIANGLES, 6, gl.GL_UNSIGNED_INT, None)